@@ -102,6 +102,7 @@ class AppSettings:
     session_timeout_minutes: int = 30
     max_chat_history: int = 100
     auto_save_sessions: bool = True
+    record_tool_history: bool = True
     
     # Security
     enable_api_key_validation: bool = True
@@ -182,6 +183,7 @@ def load_environment_variables() -> Dict[str, Any]:
     config['session_timeout_minutes'] = int(os.getenv('SESSION_TIMEOUT_MINUTES', '30'))
     config['max_chat_history'] = int(os.getenv('MAX_CHAT_HISTORY', '100'))
     config['auto_save_sessions'] = os.getenv('AUTO_SAVE_SESSIONS', 'true').lower() == 'true'
+    config['record_tool_history'] = os.getenv('RECORD_TOOL_HISTORY', 'true').lower() == 'true'
     
     # Security
     config['enable_api_key_validation'] = os.getenv('ENABLE_API_KEY_VALIDATION', 'true').lower() == 'true'
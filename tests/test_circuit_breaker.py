@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for the CircuitBreaker state machine and its use by retry_with_backoff."""
+
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.helpers import CircuitBreaker, CircuitOpenError, retry_with_backoff
+
+
+class _FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _failing(times, exc=ConnectionError):
+    """A function failing `times` times before returning "ok", counting its calls."""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= times:
+            raise exc("boom")
+        return "ok"
+
+    return func, calls
+
+
+def test_breaker_opens_half_opens_and_closes():
+    """Threshold failures open it; after the timeout one trial runs and success closes it."""
+    print('🔍 Testing CircuitBreaker states')
+    clock = _FakeClock()
+    with mock.patch("utils.helpers.time.monotonic", clock):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0)
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        clock.now += 9.9
+        assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+        clock.now += 0.1
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow() and breaker.allow()
+    print('✅ Open, half-open and close transitions')
+
+
+def test_breaker_failed_trial_reopens():
+    """A failed half-open trial re-opens the breaker for a fresh timeout; release frees the slot."""
+    clock = _FakeClock()
+    with mock.patch("utils.helpers.time.monotonic", clock):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=5.0)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 5.0
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+        clock.now += 5.0
+        assert breaker.allow()
+        breaker.release()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+    print('✅ Failed trial re-opens')
+
+
+def test_retry_fails_fast_while_breaker_open():
+    """An open breaker stops calls with CircuitOpenError until its timeout passes."""
+    clock = _FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+    func, calls = _failing(2)
+    with mock.patch("utils.helpers.time.monotonic", clock), mock.patch("utils.helpers.time.sleep"):
+        wrapped = retry_with_backoff(max_retries=3, jitter=False, breaker=breaker)(func)
+        try:
+            wrapped()
+        except CircuitOpenError:
+            pass
+        else:
+            raise AssertionError("expected CircuitOpenError once the breaker opened")
+        assert len(calls) == 2 and breaker.state == CircuitBreaker.OPEN
+
+        clock.now += 30.0
+        assert wrapped() == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+    print('✅ Breaker short-circuits retries')
+
+
+if __name__ == "__main__":
+    test_breaker_opens_half_opens_and_closes()
+    test_breaker_failed_trial_reopens()
+    test_retry_fails_fast_while_breaker_open()
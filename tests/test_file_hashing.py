@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Tests for generate_file_hash and hash_files."""
+
+import hashlib
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.helpers import HASH_CHUNK_SIZE, generate_file_hash, hash_files
+
+_MIB = 1024 * 1024
+
+
+def _baseline_md5(path):
+    """MD5 computed the way generate_file_hash originally did (4 KiB reads)."""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(4096), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_files(tmp, sizes):
+    """Write one file of random bytes per size; returns their paths in order."""
+    paths = []
+    for i, size in enumerate(sizes):
+        path = Path(tmp) / f"f{i}.bin"
+        path.write_bytes(os.urandom(size))
+        paths.append(path)
+    return paths
+
+
+def test_digests_match_baseline_at_chunk_boundaries():
+    """Empty, exactly 1 MiB and just-over 1 MiB files hash as before."""
+    print('🔍 Testing generate_file_hash digests')
+    assert HASH_CHUNK_SIZE == _MIB
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in _write_files(tmp, [0, _MIB, _MIB + 1, 3 * _MIB + 17]):
+            assert generate_file_hash(str(path)) == _baseline_md5(path), path.stat().st_size
+        assert generate_file_hash(str(Path(tmp) / "missing.bin")) == ""
+    print('✅ Digests match the baseline')
+
+
+def test_hash_files_pool_keeps_input_order():
+    """The pooled path returns every file, keyed in input order, with baseline digests."""
+    print('🔍 Testing hash_files')
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = _write_files(tmp, [_MIB + 1, 0, 2 * _MIB, 10, _MIB, _MIB + 5])
+        paths.reverse()
+        paths.append(Path(tmp) / "missing.bin")
+        digests = hash_files(paths, max_workers=3)
+        assert list(digests) == paths
+        assert [digests[p] for p in paths[:-1]] == [_baseline_md5(p) for p in paths[:-1]]
+        assert digests[paths[-1]] == ""
+    print('✅ Input order kept')
+
+
+def test_hash_files_small_batches_skip_the_pool():
+    """Few files, or files all under one chunk, are hashed serially and keep their order."""
+    with tempfile.TemporaryDirectory() as tmp:
+        few = _write_files(tmp, [2 * _MIB, 0, _MIB + 1])
+        tmp_small = Path(tmp) / "small"
+        tmp_small.mkdir()
+        small = _write_files(tmp_small, [100, 0, 5000, 1, _MIB - 1, 7])
+        with mock.patch("utils.helpers.ThreadPoolExecutor") as pool:
+            for paths in (few[::-1], small[::-1]):
+                digests = hash_files(paths)
+                assert list(digests) == paths
+                assert [digests[p] for p in paths] == [_baseline_md5(p) for p in paths]
+        assert not pool.called
+    print('✅ Small batches hashed serially')
+
+
+if __name__ == "__main__":
+    test_digests_match_baseline_at_chunk_boundaries()
+    test_hash_files_pool_keeps_input_order()
+    test_hash_files_small_batches_skip_the_pool()
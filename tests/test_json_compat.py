@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the orjson fast paths keeping the stdlib json results."""
+
+import datetime
+import enum
+import json
+import sys
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.json_compat import json_has_long_ints, json_stdlib_native, orjson_dumps_indented
+from utils.storage import StoragePaths, write_json
+
+
+class _Color(enum.Enum):
+    RED = 1
+
+
+@dataclass
+class _Point:
+    x: int = 1
+
+
+def test_stdlib_refused_values_are_left_to_json():
+    """Values json.dumps refuses or writes differently never take the orjson path."""
+    print('🔍 Testing orjson/stdlib parity')
+    for value in (
+        datetime.datetime(2024, 1, 1),
+        uuid.UUID(int=1),
+        _Color.RED,
+        _Point(),
+        {uuid.UUID(int=1): 1},
+        {"x": float("nan")},
+        [float("inf")],
+        2 ** 70,
+    ):
+        assert orjson_dumps_indented(value) is None, value
+    print('✅ Refused values left to the stdlib')
+
+
+def test_native_values_match_json_dumps():
+    """Where orjson is used, its output parses to the same value json.dumps writes."""
+    data = {"a": [1, 2.5, None, True, "é"], "b": {"c": []}, 1: "int key"}
+    assert json_stdlib_native(data)
+    payload = orjson_dumps_indented(data)
+    if payload is not None:  # orjson installed
+        assert json.loads(payload) == json.loads(json.dumps(data, indent=2, ensure_ascii=False))
+    print('✅ Native values match')
+
+
+def test_long_int_detection():
+    """Integer runs orjson would read as floats are flagged, in str and bytes."""
+    assert json_has_long_ints('{"id": 12345678901234567890}')
+    assert json_has_long_ints(b'[1234567890123456789]')
+    assert not json_has_long_ints('{"id": 123456789012345678}')
+
+
+def test_write_json_refuses_what_json_refuses():
+    """write_json raises for a datetime and leaves no file or temp file behind."""
+    with tempfile.TemporaryDirectory() as tmp:
+        StoragePaths.ROOT_MAP["@test_json"] = Path(tmp)
+        try:
+            try:
+                write_json("@test_json", "x.json", {"when": datetime.datetime(2024, 1, 1)})
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("write_json accepted a datetime")
+            assert list(Path(tmp).iterdir()) == []
+        finally:
+            del StoragePaths.ROOT_MAP["@test_json"]
+    print('✅ write_json refuses unserialisable values')
+
+
+if __name__ == "__main__":
+    test_stdlib_refused_values_are_left_to_json()
+    test_native_values_match_json_dumps()
+    test_long_int_detection()
+    test_write_json_refuses_what_json_refuses()
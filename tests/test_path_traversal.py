@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Regression tests for path traversal checks."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.storage import StoragePaths
+from utils.validators import sanitize_file_path
+
+
+def _raises_traversal(logical_root, *parts):
+    """True if StoragePaths.resolve rejects the path as a traversal attempt."""
+    try:
+        StoragePaths.resolve(logical_root, *parts)
+    except ValueError:
+        return True
+    return False
+
+
+def test_storage_resolve_rejects_sibling_prefix():
+    """A sibling directory sharing the root's name prefix is outside the root."""
+    print('🔍 Testing StoragePaths.resolve traversal checks')
+    assert _raises_traversal("@tools", "../tools_evil/x")
+    assert _raises_traversal("@output", "../outputx/y")
+    assert _raises_traversal("@tools", "..", "tools_evil", "x")
+    assert _raises_traversal("@tools", "../../etc/passwd")
+    print('✅ Escapes rejected')
+
+
+def test_storage_resolve_allows_paths_inside_root():
+    """Paths that stay within the root, including via '..', are allowed."""
+    assert StoragePaths.resolve("@tools", "code/x.py") == Path("output/tools/code/x.py")
+    assert StoragePaths.resolve("@tools", "code/../x.json") == Path("output/tools/code/../x.json")
+    assert StoragePaths.resolve("@output", "tools", "x.json") == Path("output/tools/x.json")
+    assert StoragePaths.resolve("@tools") == Path("output/tools")
+    print('✅ Paths inside the root allowed')
+
+
+def test_sanitize_file_path_rejects_sibling_prefix():
+    """sanitize_file_path returns None for paths escaping the base directory."""
+    print('🔍 Testing sanitize_file_path traversal checks')
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "output"
+        base.mkdir()
+        (Path(tmp) / "outputx").mkdir()
+        assert sanitize_file_path("../outputx/y", str(base)) is None
+        assert sanitize_file_path("../output_evil", str(base)) is None
+        assert sanitize_file_path("../../etc/passwd", str(base)) is None
+        print('✅ Escapes rejected')
+
+
+def test_sanitize_file_path_allows_paths_inside_base():
+    """Paths inside the base directory come back resolved."""
+    with tempfile.TemporaryDirectory() as tmp:
+        base = (Path(tmp) / "output").resolve()
+        base.mkdir()
+        assert sanitize_file_path("a/b.txt", str(base)) == str(base / "a" / "b.txt")
+        assert sanitize_file_path("a/../b.txt", str(base)) == str(base / "b.txt")
+        assert sanitize_file_path(".", str(base)) == str(base)
+        print('✅ Paths inside the base allowed')
+
+
+if __name__ == "__main__":
+    test_storage_resolve_rejects_sibling_prefix()
+    test_storage_resolve_allows_paths_inside_root()
+    test_sanitize_file_path_rejects_sibling_prefix()
+    test_sanitize_file_path_allows_paths_inside_base()
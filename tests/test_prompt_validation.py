@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Tests for validate_and_sanitize_prompt against validate_prompt + sanitize_input."""
+
+import sys
+from pathlib import Path
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.validators import sanitize_input, validate_and_sanitize_prompt, validate_prompt
+
+_MAX_PROMPT_CHARS = 1_000_000
+
+
+def _two_pass(prompt):
+    """The validate-then-sanitize sequence the fused function replaces."""
+    ok, message = validate_prompt(prompt)
+    if not ok:
+        return False, message, ""
+    return True, "", sanitize_input(prompt, max_length=_MAX_PROMPT_CHARS)
+
+
+def test_matches_two_pass_results():
+    """Valid, empty, non-text and oversized prompts get the same outcome as the two passes."""
+    print('🔍 Testing validate_and_sanitize_prompt')
+    prompts = [
+        "Hello, world",
+        "tabs\tnew\nlines\r\nkept",
+        "bell\x07 esc\x1b del\x7f vt\x0b ff\x0c removed",
+        "unicode é 漢字   kept",
+        "x" * 150_000,
+        "y" * _MAX_PROMPT_CHARS,
+        "z" * (_MAX_PROMPT_CHARS + 1),
+        "",
+        None,
+        123,
+    ]
+    for prompt in prompts:
+        assert validate_and_sanitize_prompt(prompt) == _two_pass(prompt), repr(prompt)[:40]
+    print('✅ Same results as validate_prompt + sanitize_input')
+
+
+def test_documented_differences():
+    """Null bytes are stripped instead of rejected; an all-control prompt is empty."""
+    assert validate_prompt("a\x00b") == (False, "Prompt contains null bytes")
+    assert validate_and_sanitize_prompt("a\x00b") == (True, "", "ab")
+    assert _two_pass("\x01\x02") == (True, "", "")
+    assert validate_and_sanitize_prompt("\x01\x02") == (False, "Prompt cannot be empty", "")
+    assert validate_and_sanitize_prompt("\x00") == (False, "Prompt cannot be empty", "")
+    print('✅ Documented differences hold')
+
+
+if __name__ == "__main__":
+    test_matches_two_pass_results()
+    test_documented_differences()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for retry_with_backoff delays and its async branch."""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.helpers import retry_with_backoff
+
+
+def _failing(times, exc=ConnectionError):
+    """A function failing `times` times before returning "ok", counting its calls."""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= times:
+            raise exc("boom")
+        return "ok"
+
+    return func, calls
+
+
+def test_retry_delays_respect_max_delay():
+    """Without jitter the delays grow by backoff_factor and stop at max_delay."""
+    print('🔍 Testing retry_with_backoff delays')
+    func, calls = _failing(3)
+    with mock.patch("utils.helpers.time.sleep") as sleep:
+        wrapped = retry_with_backoff(max_retries=3, backoff_factor=2.0, max_delay=3.0, jitter=False)(func)
+        assert wrapped() == "ok"
+    assert len(calls) == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0]
+    print('✅ Delays capped')
+
+
+def test_retry_jitter_stays_within_bounds():
+    """With jitter each delay is between 0 and the capped backoff delay."""
+    for _ in range(50):
+        func, _calls = _failing(4)
+        with mock.patch("utils.helpers.time.sleep") as sleep:
+            retry_with_backoff(max_retries=4, backoff_factor=3.0, max_delay=5.0)(func)()
+        delays = [c.args[0] for c in sleep.call_args_list]
+        caps = [1.0, 3.0, 5.0, 5.0]
+        assert len(delays) == len(caps)
+        assert all(0.0 <= d <= cap for d, cap in zip(delays, caps)), delays
+    print('✅ Jittered delays bounded')
+
+
+def test_retry_gives_up_and_skips_other_errors():
+    """The last failure is re-raised; exceptions outside `exceptions` are not retried."""
+    func, calls = _failing(10)
+    with mock.patch("utils.helpers.time.sleep"):
+        try:
+            retry_with_backoff(max_retries=2, jitter=False)(func)()
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("expected the last ConnectionError")
+    assert len(calls) == 3
+
+    func, calls = _failing(1, exc=KeyError)
+    with mock.patch("utils.helpers.time.sleep") as sleep:
+        try:
+            retry_with_backoff(exceptions=(ConnectionError,))(func)()
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("expected KeyError to propagate")
+    assert len(calls) == 1 and not sleep.called
+    print('✅ Gives up after max_retries')
+
+
+def test_retry_async_uses_asyncio_sleep():
+    """Coroutines are awaited and back off with asyncio.sleep, never time.sleep."""
+    print('🔍 Testing retry_with_backoff async branch')
+    calls = []
+
+    @retry_with_backoff(max_retries=3, backoff_factor=2.0, max_delay=3.0, jitter=False)
+    async def flaky(x):
+        calls.append(x)
+        if len(calls) < 4:
+            raise ConnectionError("boom")
+        return x * 2
+
+    assert asyncio.iscoroutinefunction(flaky)
+    with mock.patch("utils.helpers.asyncio.sleep", new_callable=mock.AsyncMock) as async_sleep, \
+            mock.patch("utils.helpers.time.sleep") as sleep:
+        assert asyncio.run(flaky(21)) == 42
+    assert calls == [21] * 4
+    assert [c.args[0] for c in async_sleep.await_args_list] == [1.0, 2.0, 3.0]
+    assert not sleep.called
+    print('✅ Async retries awaited')
+
+
+def test_retry_async_jitter_and_give_up():
+    """Async delays are jittered within bounds and the last failure is re-raised."""
+
+    @retry_with_backoff(max_retries=2, backoff_factor=4.0, max_delay=10.0)
+    async def always_fails():
+        raise ConnectionError("boom")
+
+    with mock.patch("utils.helpers.asyncio.sleep", new_callable=mock.AsyncMock) as async_sleep:
+        try:
+            asyncio.run(always_fails())
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError("expected the last ConnectionError")
+    delays = [c.args[0] for c in async_sleep.await_args_list]
+    assert len(delays) == 2
+    assert 0.0 <= delays[0] <= 1.0 and 0.0 <= delays[1] <= 4.0
+    print('✅ Async jitter bounded')
+
+
+if __name__ == "__main__":
+    test_retry_delays_respect_max_delay()
+    test_retry_jitter_stays_within_bounds()
+    test_retry_gives_up_and_skips_other_errors()
+    test_retry_async_uses_asyncio_sleep()
+    test_retry_async_jitter_and_give_up()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the JSON Lines helpers in utils.storage."""
+
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.storage import StoragePaths, append_jsonl, read_jsonl, trim_jsonl
+
+_ROOT = "@test_jsonl"
+
+
+def _with_root(test):
+    """Run test(tmp_path) with _ROOT mapped to a fresh temporary directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        StoragePaths.ROOT_MAP[_ROOT] = Path(tmp)
+        try:
+            test(Path(tmp))
+        finally:
+            del StoragePaths.ROOT_MAP[_ROOT]
+
+
+def test_append_and_read_roundtrip():
+    """Appended records read back in order; limit keeps the newest ones."""
+    print('🔍 Testing append_jsonl/read_jsonl')
+
+    def check(tmp):
+        for i in range(5):
+            assert append_jsonl(_ROOT, "logs/run.jsonl", {"i": i, "text": "é"})
+        assert (tmp / "logs" / "run.jsonl").read_text(encoding="utf-8").count("\n") == 5
+        assert read_jsonl(_ROOT, "logs/run.jsonl") == [{"i": i, "text": "é"} for i in range(5)]
+        assert read_jsonl(_ROOT, "logs/run.jsonl", limit=2) == [{"i": 3, "text": "é"}, {"i": 4, "text": "é"}]
+        assert read_jsonl(_ROOT, "missing.jsonl") == []
+
+    _with_root(check)
+    print('✅ Records round-trip')
+
+
+def test_read_skips_blank_and_malformed_lines():
+    """Blank lines and a partially written line are skipped, not raised."""
+
+    def check(tmp):
+        (tmp / "mixed.jsonl").write_text('{"a": 1}\n\nnot json\n{"a": 2}\n{"a": 3', encoding="utf-8")
+        assert read_jsonl(_ROOT, "mixed.jsonl") == [{"a": 1}, {"a": 2}]
+        assert read_jsonl(_ROOT, "mixed.jsonl", limit=2) == [{"a": 2}]
+
+    _with_root(check)
+    print('✅ Malformed lines skipped')
+
+
+def test_trim_keeps_newest_lines():
+    """trim_jsonl keeps the last `keep` lines and leaves no temp file behind."""
+    print('🔍 Testing trim_jsonl')
+
+    def check(tmp):
+        for i in range(10):
+            append_jsonl(_ROOT, "h.jsonl", {"i": i})
+        assert trim_jsonl(_ROOT, "h.jsonl", keep=3)
+        assert read_jsonl(_ROOT, "h.jsonl") == [{"i": 7}, {"i": 8}, {"i": 9}]
+        assert trim_jsonl(_ROOT, "h.jsonl", keep=5)
+        assert len(read_jsonl(_ROOT, "h.jsonl")) == 3
+        assert trim_jsonl(_ROOT, "missing.jsonl", keep=3)
+        assert sorted(p.name for p in tmp.iterdir()) == ["h.jsonl"]
+
+    _with_root(check)
+    print('✅ Newest lines kept')
+
+
+def test_trim_failure_leaves_log_intact():
+    """If the swap fails, the original log is untouched and the temp file is removed."""
+
+    def check(tmp):
+        for i in range(4):
+            append_jsonl(_ROOT, "h.jsonl", {"i": i})
+        before = (tmp / "h.jsonl").read_bytes()
+        with mock.patch("utils.storage.os.replace", side_effect=OSError("disk full")):
+            try:
+                trim_jsonl(_ROOT, "h.jsonl", keep=1)
+            except OSError:
+                pass
+            else:
+                raise AssertionError("trim_jsonl swallowed the failed swap")
+        assert (tmp / "h.jsonl").read_bytes() == before
+        assert sorted(p.name for p in tmp.iterdir()) == ["h.jsonl"]
+
+    _with_root(check)
+    print('✅ Failed trim cleaned up')
+
+
+if __name__ == "__main__":
+    test_append_and_read_roundtrip()
+    test_read_skips_blank_and_malformed_lines()
+    test_trim_keeps_newest_lines()
+    test_trim_failure_leaves_log_intact()
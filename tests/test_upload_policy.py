@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for UploadPolicy and validate_file_upload_policy."""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Make the project packages importable when run from anywhere
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.validators import UploadPolicy, validate_file_upload, validate_file_upload_policy
+
+
+def _touch(directory, name, size=0):
+    """Create directory/name holding `size` bytes and return its path as a string."""
+    path = Path(directory) / name
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_extension_parsing_matches_path_suffix():
+    """'.env' and 'a.' have no extension; 'a.tar.gz' is checked as 'gz'."""
+    print('🔍 Testing upload extension parsing')
+    policy = UploadPolicy(("txt", "gz"))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, ext in ((".env", ""), ("a.", ""), ("noext", ""), ("a.tar.gz", "gz"), ("b.TXT", "txt")):
+            assert Path(name).suffix.lower().lstrip(".") == ext
+            ok, message = validate_file_upload_policy(_touch(tmp, name), UploadPolicy(("md",)))
+            assert not ok and message.startswith(f"File type '{ext}' not allowed"), (name, message)
+        assert validate_file_upload_policy(_touch(tmp, "a.tar.gz"), policy) == (True, "")
+        assert validate_file_upload_policy(_touch(tmp, "b.TXT"), policy) == (True, "")
+    print('✅ Extensions parsed like Path.suffix')
+
+
+def test_upper_case_allowed_types():
+    """Allowed types match case-insensitively, whether given as a list or a set."""
+    with tempfile.TemporaryDirectory() as tmp:
+        png = _touch(tmp, "photo.png")
+        for allowed in (["PNG", "Jpg"], ("PNG",), {"PNG"}, frozenset({"PNG"})):
+            policy = UploadPolicy(allowed)
+            assert "png" in policy.allowed_ext
+            assert validate_file_upload_policy(png, policy) == (True, ""), allowed
+            assert validate_file_upload(png, allowed) == (True, ""), allowed
+    print('✅ Upper-case allowed types accepted')
+
+
+def test_not_allowed_message_order():
+    """The message keeps a sequence's order and sorts a set."""
+    with tempfile.TemporaryDirectory() as tmp:
+        bmp = _touch(tmp, "a.bmp")
+        _, message = validate_file_upload(bmp, ["txt", "PNG", "gif"])
+        assert message == "File type 'bmp' not allowed. Allowed types: txt, PNG, gif"
+        _, message = validate_file_upload(bmp, {"txt", "png", "gif"})
+        assert message == "File type 'bmp' not allowed. Allowed types: gif, png, txt"
+    print('✅ Message order kept')
+
+
+def test_size_limit():
+    """Files up to max_size_mb pass; one byte more is rejected with the sizes in the message."""
+    print('🔍 Testing upload size limit')
+    policy = UploadPolicy(("bin",), max_size_mb=0.01)
+    limit = int(0.01 * 1024 * 1024)
+    assert policy.max_bytes == 0.01 * 1024 * 1024
+    with tempfile.TemporaryDirectory() as tmp:
+        assert validate_file_upload_policy(_touch(tmp, "ok.bin", limit), policy) == (True, "")
+        ok, message = validate_file_upload_policy(_touch(tmp, "big.bin", limit + 1), policy)
+        assert not ok and message == "File size (0.0MB) exceeds maximum allowed size (0.01MB)"
+        ok, message = validate_file_upload_policy(str(Path(tmp) / "missing.bin"), policy)
+        assert (ok, message) == (False, "File does not exist")
+    print('✅ Size limit enforced')
+
+
+def test_sensitive_names_rejected():
+    """Names containing sensitive markers are refused after the type and size checks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ok, message = validate_file_upload_policy(_touch(tmp, "my_secret.txt"), UploadPolicy(("txt",)))
+        assert not ok and message == "File name contains potentially sensitive information"
+        ok, _ = validate_file_upload_policy(_touch(tmp, ".env"), UploadPolicy(("",)))
+        assert not ok
+    print('✅ Sensitive names rejected')
+
+
+if __name__ == "__main__":
+    test_extension_parsing_matches_path_suffix()
+    test_upper_case_allowed_types()
+    test_not_allowed_message_order()
+    test_size_limit()
+    test_sensitive_names_rejected()
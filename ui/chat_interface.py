@@ -3,8 +3,11 @@ Main chat interface for the GenAI Agent.
 """
 
 import streamlit as st
+import os
+import random
 import time
 import json
+from datetime import datetime
 from typing import List, Dict, Any
 from config.settings import AppSettings, save_json_config
 from utils.logger import get_logger
@@ -531,8 +534,6 @@ class ChatInterface:
         """Get AI response (mock implementation)."""
         
         # This is a mock response - replace with actual GenAI API call
-        import random
-        
         responses = [
             f"Thank you for your message: '{user_input}'. I'm using the {model} model with temperature {temperature}.",
             f"I understand you're asking about '{user_input}'. Let me help you with that using {model}.",
@@ -573,9 +574,6 @@ class ChatInterface:
     def _save_chat_session(self):
         """Save current chat session."""
         try:
-            import os
-            import json
-            
             os.makedirs("output/sessions", exist_ok=True)
             
             session_data = {
@@ -602,9 +600,6 @@ class ChatInterface:
     def _export_chat(self):
         """Export chat as downloadable file."""
         try:
-            import json
-            from datetime import datetime
-            
             export_data = {
                 "exported_at": datetime.now().isoformat(),
                 "session_id": st.session_state.current_session_id,
@@ -8,7 +8,8 @@ import os
 from datetime import datetime
 from config.settings import AppSettings
 from utils.logger import get_logger
-from utils.storage import StoragePaths, list_files, read_json, write_json
+from utils.storage import StoragePaths, list_files, read_json, read_jsonl, write_json
+from .workflows import WORKFLOW_HISTORY_SUFFIX, delete_session_history, load_step_result
 
 class SessionManagerInterface:
     """Session management interface component."""
@@ -55,7 +56,7 @@ class SessionManagerInterface:
                 try:
                     data = read_json("@sessions", sf)
                     total_tool_execs += len(data.get('tool_history', []))
-                    total_workflow_runs += len(data.get('workflow_history', []))
+                    total_workflow_runs += len(self._workflow_history(sf, data))
                 except Exception:
                     continue
         except Exception:
@@ -90,6 +91,11 @@ class SessionManagerInterface:
         with c2:
             st.metric("🔗 Workflow Runs", total_workflow_runs)
     
+    def _workflow_history(self, session_file: str, session_data: dict) -> list:
+        """Workflow runs for a session: legacy entries in the session JSON plus its JSONL log."""
+        log_file = f"{os.path.splitext(session_file)[0]}{WORKFLOW_HISTORY_SUFFIX}"
+        return (session_data.get('workflow_history') or []) + read_jsonl("@sessions", log_file)
+    
     def _render_session_list(self):
         """Render the list of saved sessions."""
         
@@ -140,7 +146,7 @@ class SessionManagerInterface:
                         st.markdown(f"**💬 Messages:** {message_count}")
                         # History summaries
                         tool_hist = session_data.get('tool_history', [])
-                        wf_hist = session_data.get('workflow_history', [])
+                        wf_hist = self._workflow_history(session_file, session_data)
                         if tool_hist:
                             st.markdown(f"**🧰 Tool Executions:** {len(tool_hist)}")
                         if wf_hist:
@@ -197,9 +203,9 @@ class SessionManagerInterface:
                                     st.json(h.get('parameters', {}))
 
                     # Workflow history section
-                    if session_data.get('workflow_history'):
+                    if wf_hist:
                         with st.expander("🔗 Workflow History", expanded=False):
-                            wfh = session_data.get('workflow_history', [])
+                            wfh = wf_hist
                             st.caption(f"Showing last {min(len(wfh), 5)} of {len(wfh)}")
                             for idx, w in enumerate(wfh[-5:][::-1]):
                                 st.markdown(f"**{idx+1}. {w.get('workflow_name','workflow')}** — {w.get('execution_time','?')}s — {'✅' if w.get('success') else '❌'}")
@@ -208,6 +214,18 @@ class SessionManagerInterface:
                                         st.json(w.get('inputs', {}))
                                 if w.get('final_output'):
                                     st.code((w.get('final_output') or '')[:500], language="json")
+                                # Step outputs live in their own files; read one only when asked for
+                                for ref in w.get('step_results') or []:
+                                    if not isinstance(ref, dict) or not ref.get('path'):
+                                        continue
+                                    step_no = ref.get('step', 0) + 1
+                                    if st.checkbox(f"📄 Step {step_no} output ({ref.get('size', '?')} bytes)",
+                                                   key=f"wf_step_{session_id}_{w.get('timestamp')}_{step_no}"):
+                                        result = load_step_result(ref['path'])
+                                        if result is None:
+                                            st.caption("Step output file is no longer available")
+                                        else:
+                                            st.json(result)
             
             except Exception as e:
                 st.error(f"❌ Error loading session {session_file}: {str(e)}")
@@ -402,6 +420,8 @@ class SessionManagerInterface:
         """Delete a specific session file."""
         try:
             os.remove(session_path)
+            # Drop the session's workflow history log and step output directory as well
+            delete_session_history(os.path.splitext(os.path.basename(session_path))[0])
             st.success("✅ Session deleted!")
             
         except Exception as e:
@@ -413,11 +433,19 @@ class SessionManagerInterface:
             sessions_dir = "output/sessions"
             deleted_count = 0
             
+            history_ids = set()
             for session_file in os.listdir(sessions_dir):
-                if session_file.endswith('.json'):
-                    session_path = os.path.join(sessions_dir, session_file)
+                session_path = os.path.join(sessions_dir, session_file)
+                if session_file.endswith(WORKFLOW_HISTORY_SUFFIX):
+                    history_ids.add(session_file[:-len(WORKFLOW_HISTORY_SUFFIX)])
+                elif session_file.endswith('.json'):
                     os.remove(session_path)
                     deleted_count += 1
+                    history_ids.add(session_file[:-len('.json')])
+                elif os.path.isdir(session_path):
+                    history_ids.add(session_file)
+            for session_id in history_ids:
+                delete_session_history(session_id)
             
             st.success(f"✅ Deleted {deleted_count} sessions!")
             
@@ -3,16 +3,461 @@ Tool workshop interface for function calling and custom tools.
 """
 
 import streamlit as st
+import pandas as pd
+import ast
 import json
-import os
 import importlib.util
-import sys
+import py_compile
+import re
+import threading
 import time
+import zlib
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from config.settings import AppSettings, save_json_config
 from utils.storage import StoragePaths, read_json, write_json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+    _json_loads = json.loads
+
+_CATEGORIES = ("utility", "information", "analysis", "creative", "custom")
+_CAT_INDEX = {category: i for i, category in enumerate(_CATEGORIES)}
+
+# Python type hints for collection item types
+_ITEM_TYPE_HINTS = {
+    'string': 'str', 'str': 'str',
+    'number': 'float', 'float': 'float',
+    'integer': 'int', 'int': 'int',
+    'boolean': 'bool', 'bool': 'bool',
+    'complex': 'complex', 'bytes': 'bytes'
+}
+
+# Python type hints for scalar and mapping parameter types
+_TYPE_HINTS = {
+    # Legacy JSON types
+    'string': 'str', 'number': 'float', 'integer': 'int',
+    'boolean': 'bool', 'object': 'Dict[str, Any]',
+    # Python built-in types
+    'str': 'str', 'int': 'int', 'float': 'float', 'complex': 'complex',
+    'bool': 'bool', 'dict': 'Dict[str, Any]', 'range': 'range',
+    'bytes': 'bytes', 'bytearray': 'bytearray', 'memoryview': 'memoryview',
+    'file': 'Dict[str, Any]',  # File objects as dictionary
+    'NoneType': 'None'
+}
+
+# Type hint templates for collection parameters, filled with the item type hint
+_COLLECTION_HINTS = {
+    'array': "List[{}]",
+    'list': "List[{}]",
+    'tuple': "Tuple[{}, ...]",
+    'set': "Set[{}]",
+    'frozenset': "FrozenSet[{}]",
+}
+
+# Example processing blocks emitted into generated tool code, formatted with
+# the parameter name as ``n``
+_STRING_LIST_EXAMPLE = (
+    "        # Process {n} list\n"
+    "        if {n}:\n"
+    "            processed_{n} = [item.strip().upper() for item in {n}]\n"
+    "            result += f\"Processed {{len({n})}} items: {{', '.join(processed_{n})}}\""
+)
+_NUMBER_LIST_EXAMPLE = (
+    "        # Process {n} list\n"
+    "        if {n}:\n"
+    "            total = sum({n})\n"
+    "            avg = total / len({n}) if {n} else 0\n"
+    "            result += f\"Sum: {{total}}, Average: {{avg:.2f}}\""
+)
+_GENERIC_LIST_EXAMPLE = (
+    "        # Process {n} list\n"
+    "        if {n}:\n"
+    "            result += f\"Processing {{len({n})}} {item_type} items\""
+)
+_FILE_EXAMPLE = (
+    "        # Process {n} file\n"
+    "        if {n}:\n"
+    "            file_name = {n}.get('name', 'unknown')\n"
+    "            file_size = {n}.get('size', 0)\n"
+    "            file_type = {n}.get('type', 'unknown')\n"
+    "            file_content = {n}.get('content', b'')\n"
+    "            result += f\"File: {{file_name}} ({{file_size}} bytes, {{file_type}})\""
+)
+
+# Example block for array parameters by item type; others use _GENERIC_LIST_EXAMPLE
+_ARRAY_EXAMPLES = {
+    'string': _STRING_LIST_EXAMPLE,
+    'number': _NUMBER_LIST_EXAMPLE,
+    'integer': _NUMBER_LIST_EXAMPLE,
+}
+
+# typing names the generated signature needs for each parameter type
+_TYPE_TO_IMPORTS = {
+    'array': ('List',), 'list': ('List',),
+    'tuple': ('Tuple',),
+    'set': ('Set',),
+    'frozenset': ('FrozenSet',),
+    'dict': ('Dict', 'Any'), 'object': ('Dict', 'Any'),
+    'file': ('Dict', 'Any'),
+}
+
+# Constructors used to turn parsed list input into the declared parameter type
+_SEQ_CTOR = {"tuple": tuple, "set": set, "frozenset": frozenset, "list": list, "array": list}
+_BYTES_CTOR = {"bytes": bytes, "bytearray": bytearray, "memoryview": memoryview}
+
+# Loaded tool functions keyed by code file path, stored with the file's mtime_ns
+_TOOL_FUNCTION_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+# Tool and parameter names: letters, digits and underscores only
+_NAME_RE = re.compile(r"[A-Za-z0-9_]+\Z")
+
+# Start of a JSON object or array: a key or '}' after '{', a value or ']' after '['.
+# Python reprs such as {'a': 1} or [None], and "[ERROR] ..." messages, do not match
+_JSON_OPEN_RE = re.compile(r'\s*(?:\{\s*["}]|\[\s*[-0-9"{\[\]tfn])')
+
+# Imported configs with more tools than this are previewed in part
+_IMPORT_PREVIEW_LIMIT = 10
+
+# Serialises the session-file read-modify-write when tools run on worker threads
+_SESSION_HISTORY_LOCK = threading.Lock()
+
+# Test-form widget handler (ToolWorkshopInterface method name) per parameter type;
+# unknown types fall back to _test_input_fallback
+_TEST_INPUT_HANDLERS = {
+    "string": "_test_input_text", "str": "_test_input_text",
+    "integer": "_test_input_int", "int": "_test_input_int",
+    "number": "_test_input_float", "float": "_test_input_float",
+    "complex": "_test_input_complex",
+    "boolean": "_test_input_bool", "bool": "_test_input_bool",
+    "array": "_test_input_collection", "list": "_test_input_collection",
+    "tuple": "_test_input_collection", "set": "_test_input_collection",
+    "frozenset": "_test_input_collection",
+    "range": "_test_input_range",
+    "object": "_test_input_json", "dict": "_test_input_json",
+    "bytes": "_test_input_bytes", "bytearray": "_test_input_bytes",
+    "memoryview": "_test_input_memoryview",
+    "file": "_test_input_file",
+    "NoneType": "_test_input_none",
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_check(code: str, tool_name: str) -> Tuple[bool, str]:
+    """Syntax-check tool code, memoized so unchanged source is compiled once."""
+    try:
+        compile(code, f"<{tool_name}>", "exec")
+        return True, "Valid"
+    except SyntaxError as e:
+        return False, f"Syntax error: {e}"
+    except Exception as e:
+        return False, f"Code validation error: {e}"
+
+
+@st.cache_data(show_spinner=False, ttl=3600)
+def _load_tool_code(path: str, mtime_ns: int) -> str:
+    """Read a tool's source; mtime_ns is part of the key so edits invalidate it."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def _mock_usage(names: Tuple[str, ...]) -> Dict[str, int]:
+    """Stable pseudo usage counts (0-20) derived from each tool name."""
+    return {n: zlib.crc32(n.encode("utf-8")) % 21 for n in names}
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _read_uploaded(file_id: str, name: str, size: int, _file) -> bytes:
+    """Pull an upload's bytes once per file_id; _file is skipped when hashing."""
+    return _file.getvalue()
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _parse_uploaded_json(file_id: str, size: int, _file) -> Any:
+    """Parse an uploaded JSON file once per file_id; _file is skipped when hashing."""
+    return _json_loads(_file.getvalue())
+
+
+def _to_bytes(text: str) -> bytes:
+    """Encode widget text for the bytes-like types (UTF-8 already fast-paths ASCII)."""
+    return text.encode("utf-8")
+
+
+def _resolve_uploads(param_values: Dict[str, Any], file_params: List[str]) -> None:
+    """Replace uploaded-file handles with the name/content/type/size dict tools expect."""
+    for pname in file_params:
+        uploaded_file = param_values.get(pname)
+        if uploaded_file is not None:
+            param_values[pname] = {
+                "name": uploaded_file.name,
+                "content": _read_uploaded(
+                    uploaded_file.file_id, uploaded_file.name, uploaded_file.size, uploaded_file
+                ),
+                "type": uploaded_file.type,
+                "size": uploaded_file.size
+            }
+
+
+@lru_cache(maxsize=256)
+def _parse_complex(text: str) -> complex:
+    """Parse a complex-number widget value; empty input means 0j."""
+    return complex(text) if text else 0j
+
+
+@lru_cache(maxsize=256)
+def _defines_function(code: str, tool_name: str) -> bool:
+    """Check for a module-level def of tool_name, memoized per source text."""
+    tree = ast.parse(code)
+    return any(
+        isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == tool_name
+        for node in tree.body
+    )
+
+
+def _json_dumps_pretty(data: Any):
+    """Serialize data as indented JSON; bytes via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2)
+
+
+def _looks_like_json(text: str) -> bool:
+    """Cheap shape check for JSON object/array text, without parsing it."""
+    return _JSON_OPEN_RE.match(text) is not None and text.rstrip()[-1:] in ("}", "]")
+
+
+def _truncate(text: str, limit: int = 2000) -> str:
+    """Return text capped at limit characters."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f"...[{len(text) - limit} more chars]"
+
+
+def _freeze_params(parameters: List[Dict[str, Any]]) -> Tuple:
+    """Convert a parameter list into a hashable tuple of sorted item tuples."""
+    return tuple(tuple(sorted(param.items())) for param in parameters)
+
+
+# Source templates for generated tool functions (str.format placeholders;
+# doubled braces are literal braces in the emitted code). Rendered output is
+# memoized by _generate_function_code, so there is no compile step to prewarm.
+_NO_INPUT_FUNCTION_TEMPLATE = '''"""
+{description}
+"""
+
+def {name}():
+    """
+    {summary}
+    
+    Returns:
+        str: The processed result
+    """
+    try:
+        # Your code here
+        result = "Function executed successfully"
+        return result
+    except Exception as e:
+        return f"Error: {{e}}"'''
+
+_FUNCTION_TEMPLATE = '''{imports}"""
+{description}
+"""
+
+def {name}({param_string}):
+    """
+    {summary}
+    
+    Args:
+{args_doc_string}
+    
+    Returns:
+{output_doc_string}
+    """
+    try:
+        result = ""
+        
+{list_processing_code}
+        
+        # Return the final result
+        if not result:
+            result = f"Function executed successfully with parameters: {example_usage}"
+        
+        return result
+    except Exception as e:
+        return f"Error: {{e}}"'''
+
+
+# Placeholder source written for tools brought in via Import/Export
+_IMPORTED_STUB_TEMPLATE = '''"""
+{module_doc}
+"""
+
+def {name}():
+    """
+    {function_doc}
+    """
+    return "This is an imported tool. Please implement the actual functionality."
+'''
+
+
+@lru_cache(maxsize=64)
+def _typing_import_line(names: frozenset) -> str:
+    """Return the 'from typing import ...' header for the given names, or ''."""
+    if not names:
+        return ""
+    return f"from typing import {', '.join(sorted(names))}\n\n"
+
+
+def _emit_param_examples(input_parameters: List[Dict[str, Any]]):
+    """Yield the example processing block for each array and file parameter."""
+    for param in input_parameters:
+        param_type = param.get('type', 'string')
+        if param_type == 'array':
+            item_type = param.get('item_type', 'string')
+            template = _ARRAY_EXAMPLES.get(item_type, _GENERIC_LIST_EXAMPLE)
+            yield template.format(n=param.get('name', 'param'), item_type=item_type)
+        elif param_type == 'file':
+            yield _FILE_EXAMPLE.format(n=param.get('name', 'param'))
+
+
+def _output_doc_line(param: Dict[str, Any]) -> str:
+    """Format one output parameter as a Returns line of the generated docstring."""
+    param_type = param.get('type', 'string')
+    if param_type == 'array' and param.get('item_type'):
+        param_type += f"[{param['item_type']}]"
+    format_info = f" ({param['format']} format)" if param.get('format') else ""
+    return (f"        {param.get('name', 'result')} ({param_type}): "
+            f"{param.get('description', 'Processing result')}{format_info}")
+
+
+@lru_cache(maxsize=64)
+def _generate_function_code(tool_name: str, tool_description: str,
+                            input_parameters: Tuple, output_parameters: Tuple) -> str:
+    """Generate function code based on input and output parameters.
+
+    Parameters are passed frozen (see _freeze_params) so results can be memoized.
+    """
+    input_parameters = [dict(param) for param in input_parameters]
+    output_parameters = [dict(param) for param in output_parameters]
+    if not input_parameters:
+        return _NO_INPUT_FUNCTION_TEMPLATE.format(
+            description=tool_description or "Custom tool function.",
+            name=tool_name or "my_custom_tool",
+            summary=tool_description or "Process the input."
+        )
+    
+    # Generate parameter list
+    param_list = []
+    args_doc = []
+    
+    for param in input_parameters:
+        get = param.get
+        param_name = get('name', 'param')
+        param_type = get('type', 'string')
+        param_desc = get('description', 'Parameter')
+        param_required = get('required', True)
+        item_type = get('item_type', 'string')
+        
+        # Enhanced type hints for all Python data types
+        if param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
+            # Map item types to Python type hints
+            item_type_hint = _ITEM_TYPE_HINTS.get(item_type, 'str')
+            
+            # Generate proper collection type hints
+            type_hint = _COLLECTION_HINTS[param_type].format(item_type_hint)
+        else:
+            # Map all Python data types to proper type hints
+            type_hint = _TYPE_HINTS.get(param_type, 'str')
+        
+        if not param_required:
+            # Optional parameters of every type default to None
+            param_list.append(f"{param_name}: {type_hint} = None")
+        else:
+            param_list.append(f"{param_name}: {type_hint}")
+        
+        # Enhanced documentation for collection parameters
+        if param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
+            collection_name = param_type if param_type != 'array' else 'list'
+            args_doc.append(f"        {param_name}: {param_desc} ({collection_name} of {item_type} items)")
+        elif param_type == 'range':
+            args_doc.append(f"        {param_name}: {param_desc} (range object)")
+        elif param_type in ['bytes', 'bytearray', 'memoryview']:
+            args_doc.append(f"        {param_name}: {param_desc} ({param_type} object)")
+        elif param_type == 'complex':
+            args_doc.append(f"        {param_name}: {param_desc} (complex number)")
+        elif param_type == 'file':
+            args_doc.append(f"        {param_name}: {param_desc} (uploaded file object with name, content, type, size)")
+        else:
+            args_doc.append(f"        {param_name}: {param_desc}")
+    
+    param_string = ", ".join(param_list)
+    args_doc_string = "\n".join(args_doc)
+    
+    # Generate example usage for the default result message
+    example_params = []
+    
+    for param in input_parameters:
+        get = param.get
+        param_name = get('name', 'param')
+        param_type = get('type', 'string')
+        param_required = get('required', True)
+        
+        if param_type == 'array':
+            if param_required:
+                example_params.append(f"len({param_name})")
+            else:
+                example_params.append(f"len({param_name}) if {param_name} else 0")
+        elif param_type == 'file':
+            # Files may be missing whether or not they are required
+            example_params.append(f"{param_name}.get('name', 'no_file') if {param_name} else 'no_file'")
+        else:
+            if param_required:
+                example_params.append(f"{param_name}")
+            else:
+                example_params.append(f"{param_name} if {param_name} else 'default'")
+    
+    example_usage = ", ".join(example_params)
+    list_processing_code = "\n".join(_emit_param_examples(input_parameters)) or "        # Your processing logic here"
+    
+    # Generate output documentation
+    output_doc_string = (
+        "\n".join(map(_output_doc_line, output_parameters)) or "        str: The processed result"
+    )
+    
+    # Add imports for type hints based on parameter types
+    needed_imports = frozenset().union(
+        *(_TYPE_TO_IMPORTS.get(param.get('type', 'string'), ()) for param in input_parameters)
+    )
+    imports = _typing_import_line(needed_imports)
+    
+    return _FUNCTION_TEMPLATE.format(
+        imports=imports,
+        description=tool_description or "Custom tool function.",
+        name=tool_name or "my_custom_tool",
+        param_string=param_string,
+        summary=tool_description or "Process the input.",
+        args_doc_string=args_doc_string,
+        output_doc_string=output_doc_string,
+        list_processing_code=list_processing_code,
+        example_usage=example_usage
+    )
+
+
+def generate_function_code(tool_name: str, tool_description: str,
+                           input_parameters: List[Dict[str, Any]],
+                           output_parameters: List[Dict[str, Any]]) -> str:
+    """Generate function code based on input and output parameters."""
+    return _generate_function_code(
+        tool_name, tool_description,
+        _freeze_params(input_parameters), _freeze_params(output_parameters)
+    )
+
+
 class ToolWorkshopInterface:
     """Tool workshop interface component."""
     
@@ -20,6 +465,9 @@ class ToolWorkshopInterface:
         self.settings = settings
         self.tools_dir = StoragePaths.ROOT_MAP["@tools"]
         self.code_dir = self.tools_dir / "code"
+        self._sessions_dir = StoragePaths.ROOT_MAP["@sessions"]
+        self._sessions_dir.mkdir(parents=True, exist_ok=True)
+        self._record_history = getattr(settings, "record_tool_history", True)
         
     def load_tool_config(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Load tool configuration from JSON file."""
@@ -50,8 +498,16 @@ class ToolWorkshopInterface:
         """Import and return the tool function from its Python file."""
         try:
             code_file = self.code_dir / f"{tool_name}.py"
-            if not code_file.exists():
+            try:
+                mtime = code_file.stat().st_mtime_ns
+            except FileNotFoundError:
                 return None
+            
+            # Reuse the function loaded from this exact file version
+            cache_key = str(code_file)
+            cached = _TOOL_FUNCTION_CACHE.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
                 
             spec = importlib.util.spec_from_file_location(tool_name, code_file)
             if spec is None or spec.loader is None:
@@ -61,14 +517,19 @@ class ToolWorkshopInterface:
             spec.loader.exec_module(module)
             
             # Try to get the function with the same name as the tool
-            if hasattr(module, tool_name):
-                return getattr(module, tool_name)
+            function = getattr(module, tool_name, None)
             
             # If not found, try to find any function in the module
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if callable(attr) and not attr_name.startswith('_'):
-                    return attr
+            if function is None:
+                for attr_name in dir(module):
+                    attr = getattr(module, attr_name)
+                    if callable(attr) and not attr_name.startswith('_'):
+                        function = attr
+                        break
+            
+            if function is not None:
+                _TOOL_FUNCTION_CACHE[cache_key] = (mtime, function)
+            return function
                     
         except Exception as e:
             st.error(f"Error importing {tool_name}: {e}")
@@ -94,140 +555,201 @@ class ToolWorkshopInterface:
             return error_msg
 
     def _record_tool_history(self, tool_name: str, parameters: Dict[str, Any], result: str, success: bool, start_time: float) -> None:
-        """Append tool execution history to current session in memory and on disk."""
+        """Append tool execution history to current session in memory and on disk.
+
+        ``result`` is always the string already produced by execute_tool.
+        """
+        if not self._record_history:
+            return
         try:
             duration = max(0.0, time.time() - start_time)
             entry = {
                 "timestamp": time.time(),
                 "tool_name": tool_name,
                 "parameters": parameters,
-                "result": result[:2000] if isinstance(result, str) else str(result),
+                "result": _truncate(result),
                 "execution_time": round(duration, 3),
                 "success": success
             }
 
-            # In-memory history on session state
-            if "tool_history" not in st.session_state:
-                st.session_state.tool_history = []
-            st.session_state.tool_history.append(entry)
-            # # Keep memory list bounded
-            # if len(st.session_state.tool_history) > 200:
-            #     st.session_state.tool_history = st.session_state.tool_history[-200:]
-
-            # Also append to current session JSON on disk
-            session_id = st.session_state.get("current_session_id")
-            if session_id:
-                import os
-                os.makedirs("output/sessions", exist_ok=True)
-                session_path = f"output/sessions/{session_id}.json"
-                session_data = {}
-                try:
-                    if os.path.exists(session_path):
-                        with open(session_path, "r", encoding="utf-8") as f:
-                            session_data = json.load(f)
-                except Exception:
+            with _SESSION_HISTORY_LOCK:
+                # In-memory history on session state
+                st.session_state.setdefault("tool_history", []).append(entry)
+                # # Keep memory list bounded
+                # if len(st.session_state.tool_history) > 200:
+                #     st.session_state.tool_history = st.session_state.tool_history[-200:]
+
+                # Also append to current session JSON on disk
+                session_id = st.session_state.get("current_session_id")
+                if session_id:
+                    session_path = self._sessions_dir / f"{session_id}.json"
                     session_data = {}
+                    try:
+                        if session_path.exists():
+                            with open(session_path, "r", encoding="utf-8") as f:
+                                session_data = json.load(f)
+                    except Exception:
+                        session_data = {}
 
-                history_list = session_data.get("tool_history", [])
-                history_list.append(entry)
-                # Bound the on-disk list too
-                if len(history_list) > 500:
-                    history_list = history_list[-500:]
-                session_data["tool_history"] = history_list
+                    history_list = session_data.get("tool_history", [])
+                    history_list.append(entry)
+                    # Bound the on-disk list too
+                    if len(history_list) > 500:
+                        history_list = history_list[-500:]
+                    session_data["tool_history"] = history_list
 
-                try:
-                    with open(session_path, "w", encoding="utf-8") as f:
-                        json.dump(session_data, f, indent=2, ensure_ascii=False)
-                except Exception:
-                    # Avoid breaking execution due to logging failure
-                    pass
+                    try:
+                        with open(session_path, "w", encoding="utf-8") as f:
+                            json.dump(session_data, f, indent=2, ensure_ascii=False)
+                    except Exception:
+                        # Avoid breaking execution due to logging failure
+                        pass
         except Exception:
             # Never raise from logger
             pass
     
+    def _ui_state(self, tool_name: str) -> Dict[str, bool]:
+        """Return the per-tool UI flags (editing, delete confirmation, quick execute)."""
+        return st.session_state.setdefault("_tool_ui", {}).setdefault(tool_name, {})
+    
+    # Test-form widget handlers, dispatched through _TEST_INPUT_HANDLERS.
+    # Each takes (label, param, key, selected_tool, errors) and returns the parameter
+    # value; parse problems are appended to errors and shown once after the loop.
+    def _test_input_text(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> str:
+        return st.text_input(label, placeholder=param.get('description', ''), key=key)
+    
+    def _test_input_int(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> int:
+        return st.number_input(label, value=0, step=1, key=key)
+    
+    def _test_input_float(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> float:
+        return st.number_input(label, value=0.0, key=key)
+    
+    def _test_input_complex(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> complex:
+        complex_input = st.text_input(
+            label,
+            placeholder="1+2j",
+            key=key,
+            help="Enter complex number (e.g., 1+2j)"
+        )
+        try:
+            return _parse_complex(complex_input)
+        except ValueError:
+            errors.append(f"Invalid complex number for '{param.get('name', '')}'")
+            return 0j
+    
+    def _test_input_bool(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> bool:
+        return st.checkbox(label, key=key)
+    
+    def _test_input_collection(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> Any:
+        # Advanced collection parameter handler
+        collection_data = self._render_array_parameter_input(
+            param.get('name', ''), label, param.get('description', ''), selected_tool,
+            param.get('item_type', 'string')
+        )
+        # Convert to appropriate Python type
+        return _SEQ_CTOR.get(param.get('type'), list)(collection_data)
+    
+    def _test_input_range(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> range:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            start = st.number_input(f"{label} - Start", value=0, step=1, key=f"{key}_start")
+        with col2:
+            stop = st.number_input(f"{label} - Stop", value=10, step=1, key=f"{key}_stop")
+        with col3:
+            step = st.number_input(f"{label} - Step", value=1, step=1, key=f"{key}_step")
+        return range(start, stop, step)
+    
+    def _test_input_json(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> Any:
+        # JSON object parameter handler
+        try:
+            json_input = st.text_area(
+                label,
+                placeholder='{"key": "value"}',
+                key=key,
+                help="Enter valid JSON object"
+            )
+            if json_input.strip():
+                return _json_loads(json_input)
+            return {}
+        except json.JSONDecodeError:
+            errors.append(f"Invalid JSON for parameter '{param.get('name', '')}'")
+            return {}
+    
+    def _test_input_bytes(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> Any:
+        bytes_input = st.text_input(
+            label,
+            placeholder="Hello World",
+            key=key,
+            help="Enter text to convert to bytes"
+        )
+        return _BYTES_CTOR[param.get('type')](_to_bytes(bytes_input))
+    
+    def _test_input_memoryview(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> memoryview:
+        bytes_input = st.text_input(
+            label,
+            placeholder="Hello World",
+            key=key,
+            help="Enter text to create memoryview"
+        )
+        return memoryview(_to_bytes(bytes_input))
+    
+    def _test_input_file(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> Any:
+        # File upload parameter handler
+        uploaded_file = st.file_uploader(
+            label,
+            key=key,
+            help="Upload a file from your local system"
+        )
+        if uploaded_file is not None:
+            # Show file info
+            st.info(f"📁 Uploaded: {uploaded_file.name} ({uploaded_file.size} bytes)")
+        # Keep the upload handle; bytes are only pulled out when testing
+        return uploaded_file
+    
+    def _test_input_none(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> None:
+        st.info(f"{label}: This parameter will be set to None")
+        return None
+    
+    def _test_input_fallback(self, label: str, param: Dict[str, Any], key: str, selected_tool: str, errors: List[str]) -> str:
+        # Fallback for unknown types
+        return st.text_input(
+            label,
+            placeholder=f"Enter {param.get('type', 'string')} value",
+            key=key
+        )
+    
     def _render_array_parameter_input(self, param_name: str, label: str, param_desc: str, selected_tool: str, item_type: str = 'string') -> List[Any]:
         """Render dynamic array/list parameter input interface."""
-        # Initialize session state for this parameter's list items
+        # Rows are added/removed client-side by the data editor, so list edits
+        # no longer trigger a full script rerun per mutation
         list_key = f"test_{selected_tool}_{param_name}_list"
-        if list_key not in st.session_state:
-            st.session_state[list_key] = []
         
         st.markdown(f"**{label}**")
         if param_desc:
             st.caption(param_desc)
         
-        # Display current list items
-        current_list = st.session_state[list_key]
-        if current_list:
-            st.markdown("**Current items:**")
-            for i, item in enumerate(current_list):
-                col1, col2 = st.columns([4, 1])
-                with col1:
-                    st.text(f"{i+1}. {item}")
-                with col2:
-                    if st.button("🗑️", key=f"remove_{list_key}_{i}", help="Remove item"):
-                        st.session_state[list_key].pop(i)
-                        st.rerun()
+        if item_type in ['number', 'float']:
+            dtype, column = "float64", st.column_config.NumberColumn("Item")
+        elif item_type in ['integer', 'int']:
+            dtype, column = "Int64", st.column_config.NumberColumn("Item", step=1)
+        elif item_type in ['boolean', 'bool']:
+            dtype, column = "boolean", st.column_config.CheckboxColumn("Item")
         else:
-            st.info("No items added yet")
-        
-        # Add new item interface
-        st.markdown("**Add new item:**")
-        col1, col2 = st.columns([3, 1])
+            # Default to text entry for strings and unknown types
+            dtype, column = "object", st.column_config.TextColumn("Item")
         
-        with col1:
-            if item_type in ['string']:
-                new_item = st.text_input(
-                    "New item",
-                    key=f"new_item_{list_key}",
-                    placeholder="Enter text item",
-                    label_visibility="collapsed"
-                )
-            elif item_type in ['number', 'integer']:
-                new_item = st.number_input(
-                    "New item",
-                    key=f"new_item_{list_key}",
-                    label_visibility="collapsed"
-                )
-                if item_type == 'integer':
-                    new_item = int(new_item)
-            elif item_type == 'boolean':
-                new_item = st.checkbox(
-                    "New boolean item",
-                    key=f"new_item_{list_key}",
-                    label_visibility="collapsed"
-                )
-            else:
-                # Default to string input for unknown types
-                new_item = st.text_input(
-                    "New item",
-                    key=f"new_item_{list_key}",
-                    placeholder=f"Enter {item_type} item",
-                    label_visibility="collapsed"
-                )
+        edited = st.data_editor(
+            pd.DataFrame({"item": pd.Series(dtype=dtype)}),
+            num_rows="dynamic",
+            column_config={"item": column},
+            hide_index=True,
+            key=list_key
+        )
         
-        with col2:
-            if st.button("➕ Add", key=f"add_item_{list_key}"):
-                if item_type in ['string'] and new_item.strip():
-                    st.session_state[list_key].append(new_item)
-                    # Clear the input by triggering rerun
-                    st.rerun()
-                elif item_type in ['number', 'integer', 'boolean']:
-                    st.session_state[list_key].append(new_item)
-                    st.rerun()
-                elif new_item:  # For other types, just check if not empty
-                    st.session_state[list_key].append(new_item)
-                    st.rerun()
-                else:
-                    st.error("Please enter a value")
-        
-        # Clear all button
-        if current_list:
-            if st.button("🗑️ Clear All", key=f"clear_all_{list_key}"):
-                st.session_state[list_key] = []
-                st.rerun()
-        
-        return current_list
+        items = edited["item"].dropna().tolist()
+        if dtype == "object":
+            items = [item for item in items if str(item).strip()]
+        return items
     
     def _render_parameter_section(self, param_type: str, parameters: List[Dict[str, Any]]):
         """Render input or output parameter section."""
@@ -343,7 +865,7 @@ class ToolWorkshopInterface:
             if add_param_clicked:
                 if new_param_name and not new_param_type.startswith("---"):
                     # Check for duplicate parameter names within this parameter type
-                    existing_names = [p.get('name', '') for p in parameters]
+                    existing_names = {p.get('name', '') for p in parameters}
                     if new_param_name in existing_names:
                         st.error(f"❌ {section_title} parameter name already exists")
                     else:
@@ -395,14 +917,30 @@ class ToolWorkshopInterface:
             # Save code
             self.code_dir.mkdir(parents=True, exist_ok=True)
             code_file = self.code_dir / f"{tool_name}.py"
-            with open(code_file, 'w') as f:
-                f.write(code)
+            code_file.write_text(code, encoding="utf-8")
+            self._precompile_tool(code_file)
                 
             return True
         except Exception as e:
             st.error(f"Error creating tool {tool_name}: {e}")
             return False
     
+    def _load_code(self, code_file: Path) -> Optional[str]:
+        """Read tool source, reusing the cached copy while the file's mtime is unchanged."""
+        try:
+            mtime = code_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        return _load_tool_code(str(code_file), mtime)
+    
+    def _precompile_tool(self, code_file: Path) -> None:
+        """Write the tool's __pycache__ bytecode so later imports skip parsing."""
+        try:
+            py_compile.compile(str(code_file), doraise=False, quiet=1)
+        except Exception:
+            # A missing .pyc only costs a re-parse on import
+            pass
+    
     def validate_tool_config(self, tool_config: Dict[str, Any]) -> tuple[bool, str]:
         """Validate tool configuration with input/output parameter support."""
         required_fields = ['name', 'description', 'category']
@@ -430,7 +968,7 @@ class ToolWorkshopInterface:
         
         # Validate name format
         name = tool_config.get('name', '')
-        if not name.replace('_', '').isalnum():
+        if not _NAME_RE.match(name):
             return False, "Tool name should only contain letters, numbers, and underscores"
         
         # Support both old 'parameters' and new 'input_parameters/output_parameters' structures
@@ -458,7 +996,7 @@ class ToolWorkshopInterface:
     def _validate_parameter_list(self, parameters: List[Dict], param_type: str, valid_types: List[str], 
                                 valid_item_types: List[str], valid_output_formats: List[str] = None) -> tuple[bool, str]:
         """Validate a list of parameters (input or output)."""
-        param_names = []
+        param_names = set()
         
         for i, param in enumerate(parameters):
             param_num = i + 1
@@ -473,13 +1011,13 @@ class ToolWorkshopInterface:
             param_type_value = param.get('type', '')
             
             # Validate parameter name format
-            if not param_name.replace('_', '').isalnum():
+            if not _NAME_RE.match(param_name):
                 return False, f"{param_type.title()} parameter {param_num} name '{param_name}' should only contain letters, numbers, and underscores"
             
             # Check for duplicate parameter names
             if param_name in param_names:
                 return False, f"Duplicate {param_type} parameter name: '{param_name}'"
-            param_names.append(param_name)
+            param_names.add(param_name)
             
             # Validate parameter type
             if param_type_value not in valid_types:
@@ -531,13 +1069,7 @@ class ToolWorkshopInterface:
             return False, f"Code must contain function definition: def {tool_name}("
         
         # Basic syntax check (can be enhanced)
-        try:
-            compile(code, f"<{tool_name}>", "exec")
-            return True, "Valid"
-        except SyntaxError as e:
-            return False, f"Syntax error: {e}"
-        except Exception as e:
-            return False, f"Code validation error: {e}"
+        return _compile_check(code, tool_name)
     
     def render_available_tools_section(self, all_tools):
         """Render the available tools section."""
@@ -547,195 +1079,221 @@ class ToolWorkshopInterface:
             st.info("No tools found in output/tools/ directory. Create some tools to get started!")
             return
             
+        # One overview table and one action bar replace per-tool status/button columns
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "Tool": tool_name,
+                    "Category": tool_config.get('category', 'unknown'),
+                    "Enabled": tool_config.get('enabled', True),
+                    "Code": (self.code_dir / f"{tool_name}.py").exists(),
+                }
+                for tool_name, tool_config in all_tools.items()
+            ]),
+            hide_index=True
+        )
+        
+        selected_tool = st.selectbox("Act on tool:", list(all_tools.keys()), key="tool_action_target")
+        selected_state = self._ui_state(selected_tool)
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            if st.button("🔁 Toggle", key="tool_action_toggle"):
+                if self.toggle_tool_status(selected_tool):
+                    st.success(f"Toggled {selected_tool}")
+                    st.rerun()
+                else:
+                    st.error(f"Failed to toggle {selected_tool}")
+        
+        with col2:
+            if st.button("📝 Edit Config", key="tool_action_edit_config"):
+                selected_state["editing_config"] = True
+                st.rerun()
+        
+        with col3:
+            if st.button("🐍 Edit Code", key="tool_action_edit_code"):
+                selected_state["editing_code"] = True
+                st.rerun()
+        
+        with col4:
+            # Delete button with confirmation
+            if st.button("🗑️ Delete", key="tool_action_delete"):
+                selected_state["confirm_delete"] = True
+                st.rerun()
+        
+        # Handle editing states
+        if selected_state.get("editing_config", False):
+            self.render_edit_config_interface(selected_tool, all_tools[selected_tool])
+        
+        if selected_state.get("editing_code", False):
+            self.render_edit_code_interface(selected_tool)
+        
+        if selected_state.get("confirm_delete", False):
+            self.render_delete_confirmation(selected_tool)
+        
         # Display loaded tools
         for tool_name, tool_config in all_tools.items():
+            ui_state = self._ui_state(tool_name)
+            
+            # Disabled tools stay collapsed to a single line until asked for
+            if not tool_config.get('enabled', True) and not ui_state.get("show_disabled", False):
+                st.caption(f"🔧 {tool_name} (disabled)")
+                if st.button("Show", key=f"show_disabled_{tool_name}"):
+                    ui_state["show_disabled"] = True
+                    st.rerun()
+                continue
+            
             with st.expander(f"🔧 {tool_name}", expanded=False):
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+                st.markdown(f"**Description:** {tool_config.get('description', 'No description')}")
+                st.caption(f"Category: {tool_config.get('category', 'unknown')}")
                 
-                with col1:
-                    st.markdown(f"**Description:** {tool_config.get('description', 'No description')}")
-                    st.caption(f"Category: {tool_config.get('category', 'unknown')}")
-                    
-                    # Show parameters - support both old and new structures
-                    input_params = tool_config.get('input_parameters', tool_config.get('parameters', []))
-                    output_params = tool_config.get('output_parameters', [])
-                    
-                    if input_params:
-                        st.markdown("**📥 Input Parameters:**")
-                        for param in input_params:
-                            required_text = " *(required)*" if param.get('required', False) else " *(optional)*"
-                            param_name = param.get('name', 'unknown')
-                            param_type = param.get('type', 'unknown')
-                            param_desc = param.get('description', 'No description')
+                # Show parameters - support both old and new structures
+                input_params = tool_config.get('input_parameters', tool_config.get('parameters', []))
+                output_params = tool_config.get('output_parameters', [])
+                
+                if input_params:
+                    st.markdown("**📥 Input Parameters:**")
+                    for param in input_params:
+                        get = param.get
+                        required_text = " *(required)*" if get('required', False) else " *(optional)*"
+                        param_name = get('name', 'unknown')
+                        param_type = get('type', 'unknown')
+                        param_desc = get('description', 'No description')
+                        item_type = get('item_type')
+                        
+                        # Enhanced type display for collections
+                        if item_type and param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
+                            param_type_display = f"{param_type}[{item_type}]"
+                        else:
+                            param_type_display = param_type
                             
-                            # Enhanced type display for collections
-                            if param_type in ['array', 'list', 'tuple', 'set', 'frozenset'] and param.get('item_type'):
-                                param_type_display = f"{param_type}[{param.get('item_type')}]"
-                            else:
-                                param_type_display = param_type
-                                
-                            st.caption(f"• `{param_name}` ({param_type_display}){required_text}: {param_desc}")
-                    
-                    if output_params:
-                        st.markdown("**📤 Output Parameters:**")
-                        for param in output_params:
-                            param_name = param.get('name', 'unknown')
-                            param_type = param.get('type', 'unknown')
-                            param_desc = param.get('description', 'No description')
-                            format_info = param.get('format', 'plain_text')
+                        st.caption(f"• `{param_name}` ({param_type_display}){required_text}: {param_desc}")
+                
+                if output_params:
+                    st.markdown("**📤 Output Parameters:**")
+                    for param in output_params:
+                        get = param.get
+                        param_name = get('name', 'unknown')
+                        param_type = get('type', 'unknown')
+                        param_desc = get('description', 'No description')
+                        format_info = get('format', 'plain_text')
+                        item_type = get('item_type')
+                        
+                        # Enhanced type display for collections
+                        if item_type and param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
+                            param_type_display = f"{param_type}[{item_type}]"
+                        else:
+                            param_type_display = param_type
                             
-                            # Enhanced type display for collections
-                            if param_type in ['array', 'list', 'tuple', 'set', 'frozenset'] and param.get('item_type'):
-                                param_type_display = f"{param_type}[{param.get('item_type')}]"
-                            else:
-                                param_type_display = param_type
-                                
-                            st.caption(f"• `{param_name}` ({param_type_display}, {format_info}): {param_desc}")
-                    
-                    if not input_params and not output_params:
-                        st.caption("No parameters defined")
+                        st.caption(f"• `{param_name}` ({param_type_display}, {format_info}): {param_desc}")
+                
+                if not input_params and not output_params:
+                    st.caption("No parameters defined")
 
-                    # Quick execute form
-                    st.markdown("---")
-                    st.markdown("**⚡ Quick Execute**")
-                    with st.form(f"quick_exec_{tool_name}"):
-                        param_values = {}
-                        for param in input_params:
-                            pname = param.get('name', '')
-                            ptype = param.get('type', 'string')
-                            pdesc = param.get('description', '')
-                            preq = param.get('required', False)
-                            label = f"{pname}{' *' if preq else ''}"
-
-                            if ptype in ["string", "str"]:
-                                param_values[pname] = st.text_input(label, placeholder=pdesc, key=f"qe_{tool_name}_{pname}")
-                            elif ptype in ["number", "float"]:
-                                param_values[pname] = st.number_input(label, key=f"qe_{tool_name}_{pname}")
-                            elif ptype in ["integer", "int"]:
-                                v = st.number_input(label, step=1, key=f"qe_{tool_name}_{pname}")
-                                param_values[pname] = int(v)
-                            elif ptype in ["boolean", "bool"]:
-                                param_values[pname] = st.checkbox(label, key=f"qe_{tool_name}_{pname}")
-                            elif ptype in ["array", "list", "tuple", "set", "frozenset"]:
-                                raw = st.text_area(
-                                    label + " (JSON array)",
-                                    placeholder=pdesc or "[1,2,3] or [\"a\",\"b\"]",
-                                    key=f"qe_{tool_name}_{pname}"
-                                )
-                                try:
-                                    arr = json.loads(raw) if raw.strip() else []
-                                    if not isinstance(arr, list):
-                                        arr = []
-                                except Exception:
-                                    arr = []
-                                    st.warning(f"Invalid JSON for {pname}; using empty list")
-                                if ptype == "tuple":
-                                    param_values[pname] = tuple(arr)
-                                elif ptype == "set":
-                                    param_values[pname] = set(arr)
-                                elif ptype == "frozenset":
-                                    param_values[pname] = frozenset(arr)
-                                else:
-                                    param_values[pname] = list(arr)
-                            elif ptype == "range":
-                                c1, c2, c3 = st.columns(3)
-                                with c1:
-                                    start = st.number_input(f"{label} - Start", value=0, step=1, key=f"qe_{tool_name}_{pname}_start")
-                                with c2:
-                                    stop = st.number_input(f"{label} - Stop", value=10, step=1, key=f"qe_{tool_name}_{pname}_stop")
-                                with c3:
-                                    step = st.number_input(f"{label} - Step", value=1, step=1, key=f"qe_{tool_name}_{pname}_step")
-                                param_values[pname] = range(int(start), int(stop), int(step))
-                            elif ptype in ["object", "dict"]:
-                                raw = st.text_area(label, placeholder=pdesc or '{"key":"value"}', key=f"qe_{tool_name}_{pname}")
-                                try:
-                                    param_values[pname] = json.loads(raw) if raw.strip() else {}
-                                except Exception:
-                                    param_values[pname] = {}
-                                    st.warning(f"Invalid JSON for {pname}; using empty object")
-                            elif ptype in ["bytes", "bytearray"]:
-                                txt = st.text_input(label, placeholder=pdesc, key=f"qe_{tool_name}_{pname}")
-                                param_values[pname] = (txt.encode('utf-8') if ptype == 'bytes' else bytearray(txt.encode('utf-8'))) if txt else (b'' if ptype == 'bytes' else bytearray())
-                            elif ptype == "memoryview":
-                                txt = st.text_input(label, placeholder=pdesc, key=f"qe_{tool_name}_{pname}")
-                                param_values[pname] = memoryview(txt.encode('utf-8')) if txt else memoryview(b'')
-                            elif ptype == "file":
-                                up = st.file_uploader(label, key=f"qe_{tool_name}_{pname}")
-                                if up is not None:
-                                    content = up.read()
-                                    param_values[pname] = {"name": up.name, "content": content, "type": up.type, "size": len(content)}
-                                else:
-                                    param_values[pname] = None
-                            elif ptype == "NoneType":
-                                st.info(f"{label}: This parameter will be set to None")
-                                param_values[pname] = None
-                            else:
-                                param_values[pname] = st.text_input(label, placeholder=f"Enter {ptype} value", key=f"qe_{tool_name}_{pname}")
+                # Quick execute form
+                st.markdown("---")
+                st.markdown("**⚡ Quick Execute**")
+                if ui_state.get("quick_execute", False):
+                    if st.button("⏹️ Hide", key=f"hide_qe_{tool_name}"):
+                        ui_state["quick_execute"] = False
+                        st.rerun()
+                    # Only the opened tool builds its input widgets
+                    self.render_quick_execute_form(tool_name, input_params)
+                elif st.button("▶️ Quick Execute", key=f"show_qe_{tool_name}"):
+                    ui_state["quick_execute"] = True
+                    st.rerun()
+    
+    def render_quick_execute_form(self, tool_name: str, input_params: List[Dict[str, Any]]):
+        """Render the quick execute form for a single tool."""
+        with st.form(f"quick_exec_{tool_name}"):
+            param_values = {}
+            file_params = []
+            input_warnings: List[str] = []
+            warning_slot = st.empty()
+            # (name, type, label, description, required, item_type) per parameter
+            specs = []
+            for param in input_params:
+                pname = param.get('name', '')
+                preq = param.get('required', False)
+                specs.append((
+                    pname,
+                    param.get('type', 'string'),
+                    f"{pname}{' *' if preq else ''}",
+                    param.get('description', ''),
+                    preq,
+                    param.get('item_type', 'string'),
+                ))
+            for pname, ptype, label, pdesc, preq, _item_type in specs:
+                if ptype in ["string", "str"]:
+                    param_values[pname] = st.text_input(label, placeholder=pdesc, key=f"qe_{tool_name}_{pname}")
+                elif ptype in ["number", "float"]:
+                    param_values[pname] = st.number_input(label, key=f"qe_{tool_name}_{pname}")
+                elif ptype in ["integer", "int"]:
+                    param_values[pname] = st.number_input(label, value=0, step=1, key=f"qe_{tool_name}_{pname}")
+                elif ptype in ["boolean", "bool"]:
+                    param_values[pname] = st.checkbox(label, key=f"qe_{tool_name}_{pname}")
+                elif ptype in ["array", "list", "tuple", "set", "frozenset"]:
+                    raw = st.text_area(
+                        label + " (JSON array)",
+                        placeholder=pdesc or "[1,2,3] or [\"a\",\"b\"]",
+                        key=f"qe_{tool_name}_{pname}"
+                    )
+                    try:
+                        arr = _json_loads(raw) if raw.strip() else []
+                        if not isinstance(arr, list):
+                            arr = []
+                    except Exception:
+                        arr = []
+                        input_warnings.append(f"Invalid JSON for {pname}; using empty list")
+                    param_values[pname] = _SEQ_CTOR.get(ptype, list)(arr)
+                elif ptype == "range":
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        start = st.number_input(f"{label} - Start", value=0, step=1, key=f"qe_{tool_name}_{pname}_start")
+                    with c2:
+                        stop = st.number_input(f"{label} - Stop", value=10, step=1, key=f"qe_{tool_name}_{pname}_stop")
+                    with c3:
+                        step = st.number_input(f"{label} - Step", value=1, step=1, key=f"qe_{tool_name}_{pname}_step")
+                    param_values[pname] = range(start, stop, step)
+                elif ptype in ["object", "dict"]:
+                    raw = st.text_area(label, placeholder=pdesc or '{"key":"value"}', key=f"qe_{tool_name}_{pname}")
+                    try:
+                        param_values[pname] = _json_loads(raw) if raw.strip() else {}
+                    except Exception:
+                        param_values[pname] = {}
+                        input_warnings.append(f"Invalid JSON for {pname}; using empty object")
+                elif ptype in _BYTES_CTOR:
+                    txt = st.text_input(label, placeholder=pdesc, key=f"qe_{tool_name}_{pname}")
+                    param_values[pname] = _BYTES_CTOR[ptype](_to_bytes(txt))
+                elif ptype == "file":
+                    # Keep the upload handle; bytes are only pulled out on Execute
+                    param_values[pname] = st.file_uploader(label, key=f"qe_{tool_name}_{pname}")
+                    file_params.append(pname)
+                elif ptype == "NoneType":
+                    st.info(f"{label}: This parameter will be set to None")
+                    param_values[pname] = None
+                else:
+                    param_values[pname] = st.text_input(label, placeholder=f"Enter {ptype} value", key=f"qe_{tool_name}_{pname}")
+            if input_warnings:
+                warning_slot.warning("\n\n".join(input_warnings))
 
-                        run_clicked = st.form_submit_button("▶️ Execute", type="primary")
+            run_clicked = st.form_submit_button("▶️ Execute", type="primary")
 
-                    if run_clicked:
-                        # Validate requireds
-                        missing = [p.get('name','') for p in input_params if p.get('required', False) and not param_values.get(p.get('name',''))]
-                        if missing:
-                            st.error(f"Missing required: {', '.join(missing)}")
-                        else:
-                            with st.spinner(f"Running {tool_name}..."):
-                                result = self.execute_tool(tool_name, param_values)
-                                # Try parse JSON
-                                try:
-                                    parsed = json.loads(result)
-                                    st.json(parsed)
-                                except Exception:
-                                    st.text_area("Result", value=result, height=150, disabled=True)
-                
-                with col2:
-                    enabled = tool_config.get('enabled', True)
-                    if enabled:
-                        st.success("✅ Enabled")
-                    else:
-                        st.warning("❌ Disabled")
-                    
-                    # Toggle button
-                    if st.button("Toggle", key=f"toggle_{tool_name}"):
-                        if self.toggle_tool_status(tool_name):
-                            st.success(f"Toggled {tool_name}")
-                            st.rerun()
-                        else:
-                            st.error(f"Failed to toggle {tool_name}")
-                
-                with col3:
-                    # Check if code file exists
-                    code_file = self.code_dir / f"{tool_name}.py"
-                    if code_file.exists():
-                        st.caption("✅ Code exists")
+        if run_clicked:
+            # Validate requireds; only build the list of names when something is missing
+            if any(preq and not param_values.get(pname) for pname, _, _, _, preq, _ in specs):
+                missing = [pname for pname, _, _, _, preq, _ in specs if preq and not param_values.get(pname)]
+                st.error(f"Missing required: {', '.join(missing)}")
+            else:
+                with st.spinner(f"Running {tool_name}..."):
+                    _resolve_uploads(param_values, file_params)
+                    result = self.execute_tool(tool_name, param_values)
+                    # JSON-shaped results go to st.json as text, which the browser parses;
+                    # tool reprs and plain text (e.g. "[ERROR] ...") are shown as text
+                    if _looks_like_json(result):
+                        st.json(result)
                     else:
-                        st.caption("❌ Code missing")
-                    
-                    # Edit buttons
-                    if st.button("📝 Edit Config", key=f"edit_config_{tool_name}"):
-                        st.session_state[f"editing_config_{tool_name}"] = True
-                        st.rerun()
-                    
-                    if st.button("🐍 Edit Code", key=f"edit_code_{tool_name}"):
-                        st.session_state[f"editing_code_{tool_name}"] = True
-                        st.rerun()
-                
-                with col4:
-                    # Delete button with confirmation
-                    if st.button("🗑️ Delete", key=f"delete_{tool_name}"):
-                        st.session_state[f"confirm_delete_{tool_name}"] = True
-                        st.rerun()
-                
-                # Handle editing states
-                if st.session_state.get(f"editing_config_{tool_name}", False):
-                    self.render_edit_config_interface(tool_name, tool_config)
-                
-                if st.session_state.get(f"editing_code_{tool_name}", False):
-                    self.render_edit_code_interface(tool_name)
-                
-                if st.session_state.get(f"confirm_delete_{tool_name}", False):
-                    self.render_delete_confirmation(tool_name)
+                        st.text_area("Result", value=result, height=150, disabled=True)
     
     def render_edit_config_interface(self, tool_name, tool_config):
         """Render the edit configuration interface."""
@@ -761,10 +1319,8 @@ class ToolWorkshopInterface:
                 
                 new_category = st.selectbox(
                     "Category",
-                    ["utility", "information", "analysis", "creative", "custom"],
-                    index=["utility", "information", "analysis", "creative", "custom"].index(
-                        tool_config.get('category', 'utility')
-                    ),
+                    _CATEGORIES,
+                    index=_CAT_INDEX.get(tool_config.get('category', 'utility'), 0),
                     key=f"edit_category_{tool_name}"
                 )
             
@@ -818,14 +1374,14 @@ class ToolWorkshopInterface:
                                 old_config_file.unlink()
                         
                         st.success("✅ Configuration updated!")
-                        st.session_state[f"editing_config_{tool_name}"] = False
+                        self._ui_state(tool_name)["editing_config"] = False
                         st.rerun()
                     else:
                         st.error("❌ Failed to save configuration")
             
             with col2:
                 if st.form_submit_button("❌ Cancel"):
-                    st.session_state[f"editing_config_{tool_name}"] = False
+                    self._ui_state(tool_name)["editing_config"] = False
                     st.rerun()
     
     def render_edit_code_interface(self, tool_name):
@@ -835,15 +1391,13 @@ class ToolWorkshopInterface:
         
         # Load current code
         code_file = self.code_dir / f"{tool_name}.py"
-        current_code = ""
+        try:
+            current_code = self._load_code(code_file)
+        except Exception as e:
+            st.error(f"Error reading code file: {e}")
+            current_code = ""
         
-        if code_file.exists():
-            try:
-                with open(code_file, 'r', encoding='utf-8') as f:
-                    current_code = f.read()
-            except Exception as e:
-                st.error(f"Error reading code file: {e}")
-        else:
+        if current_code is None:
             current_code = f'''"""
 {tool_name} function implementation.
 """
@@ -875,11 +1429,11 @@ def {tool_name}():
                         try:
                             # Save the code
                             self.code_dir.mkdir(parents=True, exist_ok=True)
-                            with open(code_file, 'w', encoding='utf-8') as f:
-                                f.write(new_code)
+                            code_file.write_text(new_code, encoding='utf-8')
+                            self._precompile_tool(code_file)
                             
                             st.success("✅ Code updated successfully!")
-                            st.session_state[f"editing_code_{tool_name}"] = False
+                            self._ui_state(tool_name)["editing_code"] = False
                             st.rerun()
                         except Exception as e:
                             st.error(f"❌ Failed to save code: {e}")
@@ -893,31 +1447,13 @@ def {tool_name}():
                     
                     if is_valid:
                         try:
-                            # Try to compile and execute a basic test
-                            compile(new_code, f"<{tool_name}>", "exec")
                             st.success("✅ Code syntax is valid!")
                             
-                            # Try to import the function (basic test)
-                            import tempfile
-                            import sys
-                            
-                            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
-                                temp_file.write(new_code)
-                                temp_file.flush()
-                                
-                                spec = importlib.util.spec_from_file_location(tool_name, temp_file.name)
-                                if spec and spec.loader:
-                                    module = importlib.util.module_from_spec(spec)
-                                    spec.loader.exec_module(module)
-                                    
-                                    if hasattr(module, tool_name):
-                                        st.success("✅ Function can be imported successfully!")
-                                    else:
-                                        st.warning("⚠️ Function defined but not found in module")
-                                
-                                # Clean up
-                                import os
-                                os.unlink(temp_file.name)
+                            # Confirm the function is defined at module level without executing the code
+                            if _defines_function(new_code, tool_name):
+                                st.success("✅ Function is defined at module level!")
+                            else:
+                                st.warning("⚠️ Function defined but not found in module")
                                 
                         except Exception as e:
                             st.error(f"❌ Code test failed: {e}")
@@ -926,7 +1462,7 @@ def {tool_name}():
             
             with col3:
                 if st.form_submit_button("❌ Cancel"):
-                    st.session_state[f"editing_code_{tool_name}"] = False
+                    self._ui_state(tool_name)["editing_code"] = False
                     st.rerun()
     
     def render_delete_confirmation(self, tool_name):
@@ -942,24 +1478,20 @@ def {tool_name}():
             if st.button("✅ Yes, Delete", key=f"confirm_delete_yes_{tool_name}", type="primary"):
                 try:
                     # Delete JSON config
-                    config_file = self.tools_dir / f"{tool_name}.json"
-                    if config_file.exists():
-                        config_file.unlink()
+                    (self.tools_dir / f"{tool_name}.json").unlink(missing_ok=True)
                     
                     # Delete Python code
-                    code_file = self.code_dir / f"{tool_name}.py"
-                    if code_file.exists():
-                        code_file.unlink()
+                    (self.code_dir / f"{tool_name}.py").unlink(missing_ok=True)
                     
                     st.success(f"✅ Deleted {tool_name}")
-                    st.session_state[f"confirm_delete_{tool_name}"] = False
+                    st.session_state["_tool_ui"].pop(tool_name, None)
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Error deleting {tool_name}: {e}")
         
         with col2:
             if st.button("❌ Cancel", key=f"confirm_delete_no_{tool_name}"):
-                st.session_state[f"confirm_delete_{tool_name}"] = False
+                self._ui_state(tool_name)["confirm_delete"] = False
                 st.rerun()
     
     def render_custom_tools_section(self, all_tools):
@@ -984,14 +1516,10 @@ def {tool_name}():
                         if st.button("🗑️ Delete", key=f"delete_{tool_name}"):
                             try:
                                 # Delete JSON config
-                                config_file = self.tools_dir / f"{tool_name}.json"
-                                if config_file.exists():
-                                    config_file.unlink()
+                                (self.tools_dir / f"{tool_name}.json").unlink(missing_ok=True)
                                 
                                 # Delete Python code
-                                code_file = self.code_dir / f"{tool_name}.py"
-                                if code_file.exists():
-                                    code_file.unlink()
+                                (self.code_dir / f"{tool_name}.py").unlink(missing_ok=True)
                                 
                                 st.success(f"Deleted {tool_name}")
                                 st.rerun()
@@ -1019,273 +1547,31 @@ def {tool_name}():
             
             tool_category = st.selectbox(
                 "Category",
-                ["utility", "information", "analysis", "creative", "custom"]
+                _CATEGORIES
             )
             
             # Parameters section - Input/Output parameters support
             st.markdown("#### Parameters")
             
-            # Initialize parameter lists in session state
-            if 'tool_input_parameters' not in st.session_state:
-                st.session_state.tool_input_parameters = []
-            if 'tool_output_parameters' not in st.session_state:
-                st.session_state.tool_output_parameters = []
+            # Initialize parameter lists in session state and bind them once
+            in_params = st.session_state.setdefault('tool_input_parameters', [])
+            out_params = st.session_state.setdefault('tool_output_parameters', [])
             
             # Create tabs for input and output parameters
             input_tab, output_tab = st.tabs(["📥 Input Parameters", "📤 Output Parameters"])
             
             with input_tab:
-                self._render_parameter_section("input", st.session_state.tool_input_parameters)
+                self._render_parameter_section("input", in_params)
             
             with output_tab:
-                self._render_parameter_section("output", st.session_state.tool_output_parameters)
-            
-            # Function code generation
-            def generate_function_code(tool_name, tool_description, input_parameters, output_parameters):
-                """Generate function code based on input and output parameters."""
-                if not input_parameters:
-                    return f'''"""
-{tool_description or "Custom tool function."}
-"""
-
-def {tool_name or "my_custom_tool"}():
-    """
-    {tool_description or "Process the input."}
-    
-    Returns:
-        str: The processed result
-    """
-    try:
-        # Your code here
-        result = "Function executed successfully"
-        return result
-    except Exception as e:
-        return f"Error: {{e}}"'''
-                
-                # Generate parameter list
-                param_list = []
-                args_doc = []
-                
-                for param in input_parameters:
-                    param_name = param.get('name', 'param')
-                    param_type = param.get('type', 'string')
-                    param_desc = param.get('description', 'Parameter')
-                    param_required = param.get('required', True)
-                    item_type = param.get('item_type', 'string')
-                    
-                    # Enhanced type hints for all Python data types
-                    if param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
-                        # Map item types to Python type hints
-                        item_type_hint_map = {
-                            'string': 'str', 'str': 'str',
-                            'number': 'float', 'float': 'float', 
-                            'integer': 'int', 'int': 'int',
-                            'boolean': 'bool', 'bool': 'bool',
-                            'complex': 'complex', 'bytes': 'bytes'
-                        }
-                        item_type_hint = item_type_hint_map.get(item_type, 'str')
-                        
-                        # Generate proper collection type hints
-                        if param_type == 'array':
-                            type_hint = f"List[{item_type_hint}]"
-                        elif param_type == 'list':
-                            type_hint = f"List[{item_type_hint}]"
-                        elif param_type == 'tuple':
-                            type_hint = f"Tuple[{item_type_hint}, ...]"
-                        elif param_type == 'set':
-                            type_hint = f"Set[{item_type_hint}]"
-                        elif param_type == 'frozenset':
-                            type_hint = f"FrozenSet[{item_type_hint}]"
-                    else:
-                        # Map all Python data types to proper type hints
-                        type_hint_map = {
-                            # Legacy JSON types
-                            'string': 'str', 'number': 'float', 'integer': 'int', 
-                            'boolean': 'bool', 'object': 'Dict[str, Any]',
-                            # Python built-in types
-                            'str': 'str', 'int': 'int', 'float': 'float', 'complex': 'complex',
-                            'bool': 'bool', 'dict': 'Dict[str, Any]', 'range': 'range',
-                            'bytes': 'bytes', 'bytearray': 'bytearray', 'memoryview': 'memoryview',
-                            'file': 'Dict[str, Any]',  # File objects as dictionary
-                            'NoneType': 'None'
-                        }
-                        type_hint = type_hint_map.get(param_type, 'str')
-                    
-                    if not param_required:
-                        # Provide appropriate default values for optional parameters
-                        if param_type in ['array', 'list']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type == 'tuple':
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['set', 'frozenset']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['dict', 'object']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type == 'range':
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['str', 'string']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['int', 'integer']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['float', 'number']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type == 'complex':
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['bool', 'boolean']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type in ['bytes', 'bytearray', 'memoryview']:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type == 'file':
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        elif param_type == 'NoneType':
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                        else:
-                            param_list.append(f"{param_name}: {type_hint} = None")
-                    else:
-                        param_list.append(f"{param_name}: {type_hint}")
-                    
-                    # Enhanced documentation for collection parameters
-                    if param_type in ['array', 'list', 'tuple', 'set', 'frozenset']:
-                        collection_name = param_type if param_type != 'array' else 'list'
-                        args_doc.append(f"        {param_name}: {param_desc} ({collection_name} of {item_type} items)")
-                    elif param_type == 'range':
-                        args_doc.append(f"        {param_name}: {param_desc} (range object)")
-                    elif param_type in ['bytes', 'bytearray', 'memoryview']:
-                        args_doc.append(f"        {param_name}: {param_desc} ({param_type} object)")
-                    elif param_type == 'complex':
-                        args_doc.append(f"        {param_name}: {param_desc} (complex number)")
-                    elif param_type == 'file':
-                        args_doc.append(f"        {param_name}: {param_desc} (uploaded file object with name, content, type, size)")
-                    else:
-                        args_doc.append(f"        {param_name}: {param_desc}")
-                
-                param_string = ", ".join(param_list)
-                args_doc_string = "\n".join(args_doc)
-                
-                # Generate enhanced examples with list-specific logic
-                example_params = []
-                list_processing_examples = []
-                
-                for param in input_parameters:
-                    param_name = param.get('name', 'param')
-                    param_type = param.get('type', 'string')
-                    item_type = param.get('item_type', 'string')
-                    
-                    if param_type == 'array':
-                        # Generate list processing example
-                        if item_type == 'string':
-                            list_processing_examples.append(f"        # Process {param_name} list")
-                            list_processing_examples.append(f"        if {param_name}:")
-                            list_processing_examples.append(f"            processed_{param_name} = [item.strip().upper() for item in {param_name}]")
-                            list_processing_examples.append(f"            result += f\"Processed {{len({param_name})}} items: {{', '.join(processed_{param_name})}}\"")
-                        elif item_type in ['number', 'integer']:
-                            list_processing_examples.append(f"        # Process {param_name} list")
-                            list_processing_examples.append(f"        if {param_name}:")
-                            list_processing_examples.append(f"            total = sum({param_name})")
-                            list_processing_examples.append(f"            avg = total / len({param_name}) if {param_name} else 0")
-                            list_processing_examples.append("            result += f\"Sum: {total}, Average: {avg:.2f}\"")
-                        else:
-                            list_processing_examples.append(f"        # Process {param_name} list")
-                            list_processing_examples.append(f"        if {param_name}:")
-                            list_processing_examples.append(f"            result += f\"Processing {{len({param_name})}} {item_type} items\"")
-                        
-                        if param.get('required', True):
-                            example_params.append(f"len({param_name})")
-                        else:
-                            example_params.append(f"len({param_name}) if {param_name} else 0")
-                    elif param_type == 'file':
-                        # Generate file processing example
-                        list_processing_examples.append(f"        # Process {param_name} file")
-                        list_processing_examples.append(f"        if {param_name}:")
-                        list_processing_examples.append(f"            file_name = {param_name}.get('name', 'unknown')")
-                        list_processing_examples.append(f"            file_size = {param_name}.get('size', 0)")
-                        list_processing_examples.append(f"            file_type = {param_name}.get('type', 'unknown')")
-                        list_processing_examples.append(f"            file_content = {param_name}.get('content', b'')")
-                        list_processing_examples.append(f"            result += f\"File: {{file_name}} ({{file_size}} bytes, {{file_type}})\"")
-                        
-                        if param.get('required', True):
-                            example_params.append(f"{param_name}.get('name', 'no_file') if {param_name} else 'no_file'")
-                        else:
-                            example_params.append(f"{param_name}.get('name', 'no_file') if {param_name} else 'no_file'")
-                    else:
-                        if param.get('required', True):
-                            example_params.append(f"{param_name}")
-                        else:
-                            example_params.append(f"{param_name} if {param_name} else 'default'")
-                
-                example_usage = ", ".join(example_params)
-                list_processing_code = "\n".join(list_processing_examples) if list_processing_examples else "        # Your processing logic here"
-                
-                # Generate output documentation
-                output_doc_lines = []
-                if output_parameters:
-                    for param in output_parameters:
-                        param_name = param.get('name', 'result')
-                        param_type = param.get('type', 'string')
-                        param_desc = param.get('description', 'Processing result')
-                        format_info = f" ({param.get('format', 'plain_text')} format)" if param.get('format') else ""
-                        
-                        if param_type == 'array' and param.get('item_type'):
-                            param_type += f"[{param.get('item_type')}]"
-                        
-                        output_doc_lines.append(f"        {param_name} ({param_type}): {param_desc}{format_info}")
-                
-                output_doc_string = "\n".join(output_doc_lines) if output_doc_lines else "        str: The processed result"
-                
-                # Add imports for type hints based on parameter types
-                needed_imports = set()
-                for param in input_parameters:
-                    param_type = param.get('type', 'string')
-                    if param_type in ['array', 'list']:
-                        needed_imports.add('List')
-                    elif param_type == 'tuple':
-                        needed_imports.add('Tuple')
-                    elif param_type == 'set':
-                        needed_imports.add('Set')
-                    elif param_type == 'frozenset':
-                        needed_imports.add('FrozenSet')
-                    elif param_type in ['dict', 'object']:
-                        needed_imports.update(['Dict', 'Any'])
-                    elif param_type == 'file':
-                        needed_imports.update(['Dict', 'Any'])
-                
-                imports = ""
-                if needed_imports:
-                    imports = f"from typing import {', '.join(sorted(needed_imports))}\n\n"
-                
-                return f'''{imports}"""
-{tool_description or "Custom tool function."}
-"""
-
-def {tool_name or "my_custom_tool"}({param_string}):
-    """
-    {tool_description or "Process the input."}
-    
-    Args:
-{args_doc_string}
-    
-    Returns:
-{output_doc_string}
-    """
-    try:
-        result = ""
-        
-{list_processing_code}
-        
-        # Return the final result
-        if not result:
-            result = f"Function executed successfully with parameters: {example_usage}"
-        
-        return result
-    except Exception as e:
-        return f"Error: {{e}}"'''
+                self._render_parameter_section("output", out_params)
             
             # Generate function code using both input and output parameters
             generated_code = generate_function_code(
                 tool_name, 
                 tool_description, 
-                st.session_state.tool_input_parameters,
-                st.session_state.tool_output_parameters
+                in_params,
+                out_params
             )
             
             # Code generation controls
@@ -1311,7 +1597,7 @@ def {tool_name or "my_custom_tool"}({param_string}):
             if submitted:
                 if tool_name and tool_description and function_code:
                     # Validate tool name
-                    if not tool_name.replace('_', '').isalnum():
+                    if not _NAME_RE.match(tool_name):
                         st.error("❌ Tool name should only contain letters, numbers, and underscores")
                     elif tool_name in all_tools:
                         st.error("❌ Tool name already exists")
@@ -1321,8 +1607,8 @@ def {tool_name or "my_custom_tool"}({param_string}):
                             "name": tool_name,
                             "description": tool_description,
                             "category": tool_category,
-                            "input_parameters": st.session_state.tool_input_parameters.copy(),
-                            "output_parameters": st.session_state.tool_output_parameters.copy(),
+                            "input_parameters": in_params.copy(),
+                            "output_parameters": out_params.copy(),
                             "code": f"{tool_name}.py",
                             "enabled": True
                         }
@@ -1362,14 +1648,16 @@ def {tool_name or "my_custom_tool"}({param_string}):
                         st.markdown("### 📤 Expected Output")
                         with st.expander("Output Parameters", expanded=False):
                             for param in output_parameters:
-                                param_name = param.get('name', 'result')
-                                param_type = param.get('type', 'string')
-                                param_desc = param.get('description', 'Processing result')
-                                format_info = param.get('format', 'plain_text')
+                                get = param.get
+                                param_name = get('name', 'result')
+                                param_type = get('type', 'string')
+                                param_desc = get('description', 'Processing result')
+                                format_info = get('format', 'plain_text')
+                                item_type = get('item_type')
                                 
                                 type_display = param_type
-                                if param_type == 'array' and param.get('item_type'):
-                                    type_display += f"[{param.get('item_type')}]"
+                                if param_type == 'array' and item_type:
+                                    type_display += f"[{item_type}]"
                                 
                                 st.markdown(f"**{param_name}** ({type_display}, {format_info} format): {param_desc}")
                     
@@ -1377,163 +1665,45 @@ def {tool_name or "my_custom_tool"}({param_string}):
                     with st.form(f"test_tool_form_{selected_tool}"):
                         # Create input fields for each parameter
                         param_values = {}
+                        file_params = []
+                        input_errors: List[str] = []
+                        error_slot = st.empty()
                         for param in input_parameters:
-                            param_name = param.get('name', '')
-                            param_type = param.get('type', 'string')
-                            param_desc = param.get('description', '')
-                            param_required = param.get('required', False)
+                            get = param.get
+                            param_name = get('name', '')
+                            param_type = get('type', 'string')
+                            param_required = get('required', False)
                             
                             label = f"{param_name}"
                             if param_required:
                                 label += " *"
                             
-                            # Handle Python built-in data types
-                            if param_type in ["string", "str"]:
-                                param_values[param_name] = st.text_input(
-                                    label, 
-                                    placeholder=param_desc,
-                                    key=f"test_{selected_tool}_{param_name}"
-                                )
-                            elif param_type in ["number", "integer", "int", "float"]:
-                                if param_type in ["integer", "int"]:
-                                    param_values[param_name] = st.number_input(
-                                        label,
-                                        value=0,
-                                        step=1,
-                                    key=f"test_{selected_tool}_{param_name}"
-                                )
-                                    param_values[param_name] = int(param_values[param_name])
-                                else:  # number, float
-                                    param_values[param_name] = st.number_input(
-                                        label,
-                                        value=0.0,
-                                        key=f"test_{selected_tool}_{param_name}"
-                                    )
-                            elif param_type == "complex":
-                                complex_input = st.text_input(
-                                    label,
-                                    placeholder="1+2j",
-                                    key=f"test_{selected_tool}_{param_name}",
-                                    help="Enter complex number (e.g., 1+2j)"
-                                )
-                                try:
-                                    param_values[param_name] = complex(complex_input) if complex_input else 0j
-                                except ValueError:
-                                    st.error(f"Invalid complex number for '{param_name}'")
-                                    param_values[param_name] = 0j
-                            elif param_type in ["boolean", "bool"]:
-                                param_values[param_name] = st.checkbox(
-                                    label,
-                                    key=f"test_{selected_tool}_{param_name}"
-                                )
-                            elif param_type in ["array", "list", "tuple", "set", "frozenset"]:
-                                # Advanced collection parameter handler
-                                collection_data = self._render_array_parameter_input(
-                                    param_name, label, param_desc, selected_tool, param.get('item_type', 'string')
-                                )
-                                # Convert to appropriate Python type
-                                if param_type == "tuple":
-                                    param_values[param_name] = tuple(collection_data)
-                                elif param_type == "set":
-                                    param_values[param_name] = set(collection_data)
-                                elif param_type == "frozenset":
-                                    param_values[param_name] = frozenset(collection_data)
-                                else:  # array, list
-                                    param_values[param_name] = list(collection_data)
-                            elif param_type == "range":
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    start = st.number_input(f"{label} - Start", value=0, step=1, key=f"test_{selected_tool}_{param_name}_start")
-                                with col2:
-                                    stop = st.number_input(f"{label} - Stop", value=10, step=1, key=f"test_{selected_tool}_{param_name}_stop")
-                                with col3:
-                                    step = st.number_input(f"{label} - Step", value=1, step=1, key=f"test_{selected_tool}_{param_name}_step")
-                                param_values[param_name] = range(int(start), int(stop), int(step))
-                            elif param_type in ["object", "dict"]:
-                                # JSON object parameter handler
-                                try:
-                                    json_input = st.text_area(
-                                        label,
-                                        placeholder='{"key": "value"}',
-                                        key=f"test_{selected_tool}_{param_name}",
-                                        help="Enter valid JSON object"
-                                    )
-                                    if json_input.strip():
-                                        param_values[param_name] = json.loads(json_input)
-                                    else:
-                                        param_values[param_name] = {}
-                                except json.JSONDecodeError:
-                                    st.error(f"Invalid JSON for parameter '{param_name}'")
-                                    param_values[param_name] = {}
-                            elif param_type in ["bytes", "bytearray"]:
-                                bytes_input = st.text_input(
-                                    label,
-                                    placeholder="Hello World",
-                                    key=f"test_{selected_tool}_{param_name}",
-                                    help="Enter text to convert to bytes"
-                                )
-                                if param_type == "bytes":
-                                    param_values[param_name] = bytes_input.encode('utf-8') if bytes_input else b''
-                                else:  # bytearray
-                                    param_values[param_name] = bytearray(bytes_input.encode('utf-8')) if bytes_input else bytearray()
-                            elif param_type == "memoryview":
-                                bytes_input = st.text_input(
-                                    label,
-                                    placeholder="Hello World",
-                                    key=f"test_{selected_tool}_{param_name}",
-                                    help="Enter text to create memoryview"
-                                )
-                                param_values[param_name] = memoryview(bytes_input.encode('utf-8')) if bytes_input else memoryview(b'')
-                            elif param_type == "file":
-                                # File upload parameter handler
-                                uploaded_file = st.file_uploader(
-                                    label,
-                                    key=f"test_{selected_tool}_{param_name}",
-                                    help="Upload a file from your local system"
-                                )
-                                if uploaded_file is not None:
-                                    # Read file content once
-                                    file_content = uploaded_file.read()
-                                    # Create a file-like object with necessary attributes
-                                    param_values[param_name] = {
-                                        'name': uploaded_file.name,
-                                        'content': file_content,
-                                        'type': uploaded_file.type,
-                                        'size': len(file_content)
-                                    }
-                                    # Show file info
-                                    st.info(f"📁 Uploaded: {uploaded_file.name} ({len(file_content)} bytes)")
-                                else:
-                                    param_values[param_name] = None
-                            elif param_type == "NoneType":
-                                st.info(f"{label}: This parameter will be set to None")
-                                param_values[param_name] = None
-                            else:
-                                # Fallback for unknown types
-                                param_values[param_name] = st.text_input(
-                                    label,
-                                    placeholder=f"Enter {param_type} value",
-                                    key=f"test_{selected_tool}_{param_name}"
-                                )
+                            # Dispatch to the widget handler for this Python built-in type
+                            handler = getattr(self, _TEST_INPUT_HANDLERS.get(param_type, "_test_input_fallback"))
+                            param_values[param_name] = handler(
+                                label, param, f"test_{selected_tool}_{param_name}", selected_tool, input_errors
+                            )
+                            if param_type == "file":
+                                file_params.append(param_name)
+                        if input_errors:
+                            error_slot.error("\n\n".join(input_errors))
                         
                         # Test button
                         test_clicked = st.form_submit_button(f"🧪 Test {selected_tool}", type="primary")
                         
                         if test_clicked:
                             # Validate required parameters
-                            missing_params = []
-                            for param in input_parameters:
-                                if param.get('required', False):
-                                    param_name = param.get('name', '')
-                                    if not param_values.get(param_name):
-                                        missing_params.append(param_name)
-                            
-                            if missing_params:
+                            if any(p.get('required', False) and not param_values.get(p.get('name', '')) for p in input_parameters):
+                                missing_params = [
+                                    p.get('name', '') for p in input_parameters
+                                    if p.get('required', False) and not param_values.get(p.get('name', ''))
+                                ]
                                 st.error(f"❌ Missing required parameters: {', '.join(missing_params)}")
                             else:
                                 # Execute the tool
                                 with st.spinner(f"Testing {selected_tool}..."):
                                     try:
+                                        _resolve_uploads(param_values, file_params)
                                         result = self.execute_tool(selected_tool, param_values)
                                         st.success("✅ Tool executed successfully!")
                                         st.text_area("Result:", value=result, height=150, disabled=True)
@@ -1550,11 +1720,8 @@ def {tool_name or "my_custom_tool"}({param_string}):
             # Real statistics based on available tools
             if all_tools:
                 # Simple usage chart (could be extended with actual usage tracking)
-                usage_data = {}
-                for tool_name in all_tools.keys():
-                    # Mock usage data - in real implementation, track actual usage
-                    import random
-                    usage_data[tool_name] = random.randint(0, 20)
+                # Mock usage data - in real implementation, track actual usage
+                usage_data = _mock_usage(tuple(all_tools.keys()))
                 
                 st.bar_chart(usage_data)
                 st.caption("Simulated tool usage statistics (in real implementation, track actual usage)")
@@ -1577,7 +1744,7 @@ def {tool_name or "my_custom_tool"}({param_string}):
                 
                 st.download_button(
                     "📤 Export Tools Config",
-                    data=json.dumps(tools_config, indent=2),
+                    data=_json_dumps_pretty(tools_config),
                     file_name="tools_config.json",
                     mime="application/json",
                     use_container_width=True
@@ -1595,37 +1762,48 @@ def {tool_name or "my_custom_tool"}({param_string}):
             
             if uploaded_config:
                 try:
-                    config_data = json.load(uploaded_config)
+                    config_data = _parse_uploaded_json(
+                        uploaded_config.file_id, uploaded_config.size, uploaded_config
+                    )
                     st.success("✅ Configuration loaded!")
                     
                     # Show preview
                     imported_tools = config_data.get('tools', {})
                     if imported_tools:
-                        st.json(imported_tools)
+                        if len(imported_tools) <= _IMPORT_PREVIEW_LIMIT or st.checkbox(
+                            f"Show all {len(imported_tools)} tools", key="import_preview_all"
+                        ):
+                            st.json(imported_tools)
+                        else:
+                            # Large configs: preview only the first few tools as plain text
+                            preview = _json_dumps_pretty(
+                                dict(islice(imported_tools.items(), _IMPORT_PREVIEW_LIMIT))
+                            )
+                            if isinstance(preview, bytes):
+                                preview = preview.decode("utf-8")
+                            st.code(
+                                preview + f"\n... {len(imported_tools) - _IMPORT_PREVIEW_LIMIT} more tools",
+                                language="json"
+                            )
                         
                         if st.button("📥 Apply Imported Configuration"):
                             # Import each tool
                             imported_count = 0
+                            self.code_dir.mkdir(parents=True, exist_ok=True)
                             for tool_name, tool_config in imported_tools.items():
                                 if self.save_tool_config(tool_name, tool_config):
                                     imported_count += 1
                                     
                                     # If there's code in the config, create a basic Python file
                                     if tool_config.get('code'):
-                                        basic_code = f'''"""
-{tool_config.get('description', 'Imported tool')}
-"""
-
-def {tool_name}():
-    """
-    {tool_config.get('description', 'Imported tool function')}
-    """
-    return "This is an imported tool. Please implement the actual functionality."
-'''
-                                        code_file = self.code_dir / f"{tool_name}.py"
-                                        self.code_dir.mkdir(parents=True, exist_ok=True)
-                                        with open(code_file, 'w') as f:
-                                            f.write(basic_code)
+                                        (self.code_dir / f"{tool_name}.py").write_text(
+                                            _IMPORTED_STUB_TEMPLATE.format(
+                                                name=tool_name,
+                                                module_doc=tool_config.get('description', 'Imported tool'),
+                                                function_doc=tool_config.get('description', 'Imported tool function')
+                                            ),
+                                            encoding="utf-8"
+                                        )
                             
                             if imported_count > 0:
                                 st.success(f"✅ Imported {imported_count} tools successfully!")
@@ -2,21 +2,222 @@
 Workflows manager: build and run chained tool workflows.
 """
 
+import copy
 import json
+import shutil
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from utils.logger import get_logger
-from utils.storage import StoragePaths, read_json, write_json
+from utils.storage import StoragePaths, append_jsonl, read_json, trim_jsonl, write_json, write_text
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from config.settings import AppSettings
-from .tool_workshop import ToolWorkshopInterface
+from .tool_workshop import ToolWorkshopInterface, _resolve_uploads
 
 
 logger = get_logger(__name__)
 
+# Workflow runs are logged to @sessions/<session_id><suffix>, one JSON entry per line
+WORKFLOW_HISTORY_SUFFIX = ".workflow_history.jsonl"
+_HISTORY_MAX_ENTRIES = 500
+_HISTORY_TRIM_EVERY = 50
+# Runs kept in st.session_state.workflow_history
+_SESSION_HISTORY_MAX = 200
+# Upper bound on independent workflow steps executed at the same time
+_MAX_PARALLEL_STEPS = 4
+# One worker keeps history writes off the render thread and in submission order
+_HISTORY_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wf-history")
+# Lines in each history log, keyed by its @sessions path; only touched on _HISTORY_WRITER
+_history_lines: Dict[str, int] = {}
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+    _json_loads = json.loads
+
+
+def _json_dumps(data: Any) -> str:
+    """Compact JSON text for step output files; non-JSON values are stringified."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _error_json(message: str) -> str:
+    """Same text as json.dumps({"error": message}) without building the dict."""
+    return '{"error": ' + json.dumps(message) + '}'
+
+
+def _json_dumps_indent(data: Any) -> str:
+    """Indented JSON text for displaying a collection output."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, default=str)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _list_workflow_files(dir_path: str, mtime_ns: int) -> List[str]:
+    """Sorted workflow names; the directory mtime key changes when files are added or removed."""
+    return sorted(p.stem for p in Path(dir_path).iterdir() if p.suffix == ".json" and p.is_file())
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _cached_load_all_tools(versions: Tuple[Tuple[str, int], ...]) -> Dict[str, Dict[str, Any]]:
+    """Parse every tool config once per set of (name, mtime_ns) versions."""
+    tools: Dict[str, Dict[str, Any]] = {}
+    for name, _ in versions:
+        config = read_json("@tools", f"{name}.json")
+        if config:
+            tools[name] = config
+    return tools
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cached_load_workflow(name: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Parse a workflow file once per version (mtime_ns is part of the key)."""
+    return read_json("@workflows", f"{name}.json")
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _read_workflow_text(path: str, mtime_ns: int) -> str:
+    """Raw workflow JSON for the Manage tab, read once per file version."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _read_step_result(path: str, mtime_ns: int) -> Any:
+    """One stored step output, parsed once per file version."""
+    return _json_loads(Path(path).read_bytes())
+
+
+def load_step_result(rel_path: str) -> Optional[Any]:
+    """Load a step output written by a workflow run, given its @sessions path.
+
+    Returns None when the file is missing or cannot be parsed.
+    """
+    try:
+        path = StoragePaths.resolve("@sessions", rel_path)
+        return _read_step_result(str(path), path.stat().st_mtime_ns)
+    except Exception:
+        return None
+
+
+def _compile_workflow(steps: List[Dict[str, Any]]) -> Tuple[List[List[Tuple[str, str, Any]]], Optional[Tuple[int, str]]]:
+    """Compile every step's inputs; also return (step_idx, key) of the first invalid ref, if any.
+
+    A ref is valid only when it points at an earlier step.
+    """
+    plan: List[List[Tuple[str, str, Any]]] = []
+    for idx, step in enumerate(steps):
+        compiled = _compile_inputs(step.get("inputs", {}))
+        for key, kind, arg in compiled:
+            if kind == "ref" and not 0 <= arg[0] < idx:
+                return plan, (idx, key)
+        plan.append(compiled)
+    return plan, None
+
+
+def _history_inputs(user_params: Dict[str, Any], file_params: List[str]) -> Dict[str, Any]:
+    """Run inputs for the history log, with uploaded file bytes reduced to name/type/size."""
+    if not file_params:
+        return user_params
+    inputs = dict(user_params)
+    for pname in file_params:
+        upload = inputs.get(pname)
+        if isinstance(upload, dict):
+            inputs[pname] = {k: upload.get(k) for k in ("name", "type", "size")}
+    return inputs
+
+
+def _compile_inputs(input_map: Dict[str, Any]) -> List[Tuple[str, str, Any]]:
+    """Turn a step's input mappings into (key, kind, arg) tuples.
+
+    kind is "ref" with arg (step, output), "param" with the top-level name, or
+    "const" with the literal value; malformed ref steps become -1 (always invalid).
+    """
+    compiled: List[Tuple[str, str, Any]] = []
+    for key, mapping in input_map.items():
+        # mapping can be {"type":"const","value":...} or {"type":"ref","step":i,"output":"name"}
+        if not isinstance(mapping, dict):
+            compiled.append((key, "const", mapping))
+            continue
+        mtype = mapping.get("type")
+        if mtype == "ref":
+            try:
+                ref_step = int(mapping.get("step", -1))
+            except (TypeError, ValueError):
+                ref_step = -1
+            compiled.append((key, "ref", (ref_step, mapping.get("output"))))
+        elif mtype == "param":
+            compiled.append((key, "param", mapping.get("name")))
+        else:
+            # Treat everything else as constant
+            compiled.append((key, "const", mapping.get("value")))
+    return compiled
+
+
+def _history_line_count(history_file: str) -> int:
+    """Number of lines currently in a session's history log (0 if it does not exist)."""
+    path = StoragePaths.resolve("@sessions", history_file)
+    if not path.is_file():
+        return 0
+    with path.open("rb") as f:
+        return sum(1 for _ in f)
+
+
+def _write_workflow_history(history_file: str, entry: Dict[str, Any],
+                            step_files: List[Tuple[str, str]]) -> None:
+    """Write one run's step outputs and history line (runs on _HISTORY_WRITER).
+
+    The log is trimmed back to _HISTORY_MAX_ENTRIES once it has grown
+    _HISTORY_TRIM_EVERY lines past it, so it stays bounded however the runs
+    are spread across browser sessions.
+    """
+    try:
+        for rel_path, text in step_files:
+            write_text("@sessions", rel_path, text)
+        lines = _history_lines.get(history_file)
+        if lines is None:
+            lines = _history_line_count(history_file)
+        append_jsonl("@sessions", history_file, entry)
+        lines += 1
+        if lines >= _HISTORY_MAX_ENTRIES + _HISTORY_TRIM_EVERY:
+            trim_jsonl("@sessions", history_file, keep=_HISTORY_MAX_ENTRIES)
+            lines = _HISTORY_MAX_ENTRIES
+        _history_lines[history_file] = lines
+    except Exception as e:
+        logger.error(f"Error writing workflow history {history_file}: {e}")
+
+
+def _remove_session_history(session_id: str) -> None:
+    """Delete a session's history log and its directory of step outputs (runs on _HISTORY_WRITER)."""
+    history_file = f"{session_id}{WORKFLOW_HISTORY_SUFFIX}"
+    _history_lines.pop(history_file, None)
+    log_path = StoragePaths.resolve("@sessions", history_file)
+    if log_path.is_file():
+        log_path.unlink()
+    session_dir = StoragePaths.resolve("@sessions", session_id)
+    if session_dir != StoragePaths.resolve("@sessions"):  # never the sessions root itself
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+
+def delete_session_history(session_id: str) -> None:
+    """Delete a session's workflow history and step outputs.
+
+    Runs on the history writer after every write queued before it, so none of
+    them can recreate files once the delete returns.
+    """
+    _HISTORY_WRITER.submit(_remove_session_history, session_id).result()
+
+
 class WorkflowsInterface:
     """Workflow builder and executor UI."""
 
@@ -29,11 +230,20 @@ class WorkflowsInterface:
 
     # ---------- Persistence ----------
     def _list_workflows(self) -> List[str]:
-        return [p.stem for p in self.workflows_dir.glob("*.json")]
+        try:
+            mtime = self.workflows_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        return _list_workflow_files(str(self.workflows_dir), mtime)
 
     def _load_workflow(self, name: str) -> Optional[Dict[str, Any]]:
         try:
-            return read_json("@workflows", f"{name}.json")
+            path = StoragePaths.resolve("@workflows", f"{name}.json")
+            try:
+                mtime = path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return None
+            return _cached_load_workflow(name, mtime)
         except Exception as e:
             st.error(f"Error loading workflow {name}: {e}")
             logger.error(f"Error loading workflow {name}: {e}")
@@ -54,83 +264,153 @@ class WorkflowsInterface:
             logger.error(f"Error saving workflow: {e}")
             return False
 
+    def _load_all_tools(self) -> Dict[str, Dict[str, Any]]:
+        """All tool configs, re-parsed only when a tool file is added, removed or saved."""
+        tools_dir = self.tools.tools_dir
+        if not tools_dir.exists():
+            return {}
+        versions = tuple(sorted((p.stem, p.stat().st_mtime_ns) for p in tools_dir.glob("*.json")))
+        return _cached_load_all_tools(versions)
+
     # ---------- Execution ----------
+    def _tool_config(self, tool_name: str) -> Dict[str, Any]:
+        """Return a tool's config, parsed once per file version and kept across reruns."""
+        cache = st.session_state.setdefault("_wf_tool_cfg_cache", {})
+        try:
+            mtime = (self.tools.tools_dir / f"{tool_name}.json").stat().st_mtime_ns
+        except FileNotFoundError:
+            cache.pop(tool_name, None)
+            return {}
+        cached = cache.get(tool_name)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self.tools.load_tool_config(tool_name) or {})
+            cache[tool_name] = cached
+        return cached[1]
+
     def _execute_workflow(self, workflow: Dict[str, Any], top_params: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[Dict[str, Any]], Optional[str]]:
-        """Run steps sequentially; each step can take inputs from previous outputs or constants.
+        """Run steps in order; each step can take inputs from previous outputs or constants.
 
-        Returns (ok, step_results, final_output_json_str)
+        Steps run one at a time in declared order, since a step may depend on another's
+        side effects (e.g. a file written under output/). Workflows saved with
+        "parallel": true instead run steps whose 'ref' inputs are all satisfied together
+        as a wave, each with its own copy of its inputs. Returns
+        (ok, step_results, final_output_json_str), where the final output is the last step's.
         """
         steps: List[Dict[str, Any]] = workflow.get("steps", [])
         if not steps:
             return False, [], "{}"
 
-        step_outputs: List[Dict[str, Any]] = []
-        final_json_str: Optional[str] = None
+        # Resolve every step's input mappings once up front, so a bad reference fails
+        # before any tool runs and the step loop only does the lookups
+        compiled_inputs, bad_ref = _compile_workflow(steps)
+        if bad_ref is not None:
+            idx, key = bad_ref
+            st.error(f"Invalid reference for input '{key}' at step {idx+1}")
+            return False, [], _error_json(f"Invalid ref for '{key}'")
 
+        # Check tools, top-level params and required inputs for every step before running any
         for idx, step in enumerate(steps):
             tool_name: str = step.get("tool")
             if not tool_name:
-                return False, step_outputs, json.dumps({"error": f"Step {idx+1} missing tool"})
-
-            # Build parameters
-            params: Dict[str, Any] = {}
-            input_map: Dict[str, Any] = step.get("inputs", {})
-
-            # Retrieve tool config to know required inputs; fallback to provided mapping
-            tool_cfg = self.tools.load_tool_config(tool_name) or {}
+                return False, [], _error_json(f"Step {idx+1} missing tool")
+
+            for key, kind, arg in compiled_inputs[idx]:
+                if kind == "param":
+                    # Reference a top-level workflow parameter by name
+                    if top_params is None:
+                        return False, [], _error_json(f"No top-level params provided for '{key}'")
+                    if arg not in top_params:
+                        return False, [], _error_json(f"Top-level param '{arg}' not provided for '{key}'")
+
+            # Ensure required inputs exist (best-effort); fallback to provided mapping
+            tool_cfg = self._tool_config(tool_name)
             tool_inputs = tool_cfg.get("input_parameters", tool_cfg.get("parameters", []))
-
-            # For each declared mapping, resolve source
-            for key, mapping in input_map.items():
-                # mapping can be {"type":"const","value":...} or {"type":"ref","step":i,"output":"name"}
-                try:
-                    mtype = mapping.get("type") if isinstance(mapping, dict) else "const"
-                    if mtype == "ref":
-                        ref_step = int(mapping.get("step", -1))
-                        ref_output = mapping.get("output")
-                        if ref_step < 0 or ref_step >= len(step_outputs):
-                            st.error(f"Invalid reference for input '{key}' at step {idx+1}")
-                            return False, step_outputs, json.dumps({"error": f"Invalid ref for '{key}'"})
-                        params[key] = step_outputs[ref_step].get(ref_output)
-                    elif mtype == "param":
-                        # Reference a top-level workflow parameter by name
-                        if top_params is None:
-                            return False, step_outputs, json.dumps({"error": f"No top-level params provided for '{key}'"})
-                        p_name = mapping.get("name")
-                        if p_name not in top_params:
-                            return False, step_outputs, json.dumps({"error": f"Top-level param '{p_name}' not provided for '{key}'"})
-                        params[key] = top_params.get(p_name)
-                    else:
-                        # Treat everything else as constant
-                        params[key] = mapping.get("value") if isinstance(mapping, dict) else mapping
-                except Exception as e:
-                    return False, step_outputs, json.dumps({"error": f"Input mapping error for '{key}': {e}"})
-
-            # Ensure required inputs exist (best-effort)
+            provided = {key for key, _, _ in compiled_inputs[idx]}
             for p in tool_inputs:
                 if p.get("required", False):
                     pname = p.get("name")
-                    if pname and pname not in params:
-                        return False, step_outputs, json.dumps({"error": f"Missing required input '{pname}' for tool '{tool_name}' at step {idx+1}"})
+                    if pname and pname not in provided:
+                        return False, [], _error_json(f"Missing required input '{pname}' for tool '{tool_name}' at step {idx+1}")
 
-            # Execute tool
-            output_str = self.tools.execute_tool(tool_name, params)
-            final_json_str = output_str
+        deps = [{arg[0] for _, kind, arg in compiled if kind == "ref"} for compiled in compiled_inputs]
+        step_outputs: List[Optional[Dict[str, Any]]] = [None] * len(steps)
+        raw_outputs: List[Optional[str]] = [None] * len(steps)
 
+        def run_step(idx: int, isolate: bool = False) -> None:
+            # Build parameters from the pre-resolved mappings
+            params: Dict[str, Any] = {}
+            for key, kind, arg in compiled_inputs[idx]:
+                if kind == "ref":
+                    params[key] = step_outputs[arg[0]].get(arg[1])
+                elif kind == "param":
+                    params[key] = top_params[arg]
+                else:
+                    params[key] = arg
+            if isolate:
+                # Concurrent steps may share a param, constant or upstream output
+                params = copy.deepcopy(params)
+            output_str = self.tools.execute_tool(steps[idx]["tool"], params)
+            raw_outputs[idx] = output_str
             # Attempt to parse as JSON; if not JSON, wrap in {"result": str}
             try:
-                parsed = json.loads(output_str)
-                step_outputs.append(parsed if isinstance(parsed, dict) else {"result": parsed})
+                parsed = _json_loads(output_str)
+                step_outputs[idx] = parsed if isinstance(parsed, dict) else {"result": parsed}
             except Exception:
-                step_outputs.append({"result": output_str})
-
-        return True, step_outputs, final_json_str
+                step_outputs[idx] = {"result": output_str}
+
+        if not workflow.get("parallel", False):
+            for idx in range(len(steps)):
+                run_step(idx)
+            return True, step_outputs, raw_outputs[-1]
+
+        done: set = set()
+        remaining = list(range(len(steps)))
+        while remaining:
+            # Refs only point backwards, so the earliest remaining step is always ready
+            wave = [i for i in remaining if deps[i] <= done]
+            if len(wave) == 1:
+                run_step(wave[0])
+            else:
+                ctx = get_script_run_ctx()
+                with ThreadPoolExecutor(
+                    max_workers=min(len(wave), _MAX_PARALLEL_STEPS),
+                    initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+                ) as pool:
+                    list(pool.map(lambda i: run_step(i, isolate=True), wave))
+            done.update(wave)
+            remaining = [i for i in remaining if i not in done]
+
+        return True, step_outputs, raw_outputs[-1]
+
+    def _step_result_refs(self, session_id: Optional[str], workflow_name: str,
+                          step_results: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]]]:
+        """Serialize each step's output and return ({step, size, path} refs, [(path, text)] to write).
+
+        Keeps history entries (in memory and in the JSONL log) bounded regardless of
+        how large intermediate payloads are. Without a current session only sizes are kept.
+        """
+        run_dir = f"{session_id}/runs/{workflow_name}_{int(time.time() * 1000)}" if session_id else None
+        refs: List[Dict[str, Any]] = []
+        files: List[Tuple[str, str]] = []
+        for idx, result in enumerate(step_results):
+            text = _json_dumps(result)
+            ref: Dict[str, Any] = {"step": idx, "size": len(text.encode("utf-8"))}
+            if run_dir:
+                ref["path"] = f"{run_dir}/step_{idx}.json"
+                files.append((ref["path"], text))
+            refs.append(ref)
+        return refs, files
 
     def _record_workflow_history(self, workflow_name: str, workflow_def: Dict[str, Any], inputs: Dict[str, Any], 
                                  success: bool, final_output: Optional[str], start_time: float,
                                  step_results: List[Dict[str, Any]]) -> None:
-        """Append workflow execution history to current session in memory and on disk."""
+        """Append workflow execution history to current session in memory and on disk.
+
+        The entry is built here; the disk writes run on the background history writer.
+        """
         try:
+            session_id = st.session_state.get("current_session_id")
+            step_refs, step_files = self._step_result_refs(session_id, workflow_name, step_results)
             duration = max(0.0, time.time() - start_time)
             entry = {
                 "timestamp": time.time(),
@@ -140,53 +420,34 @@ class WorkflowsInterface:
                 "success": success,
                 "execution_time": round(duration, 3),
                 "final_output": (final_output[:2000] if isinstance(final_output, str) else str(final_output)) if final_output is not None else None,
-                "step_results": step_results
+                "step_results": step_refs
             }
 
-            # In-memory list
-            if "workflow_history" not in st.session_state:
-                st.session_state.workflow_history = []
-            st.session_state.workflow_history.append(entry)
-            # if len(st.session_state.workflow_history) > 200:
-            #     st.session_state.workflow_history = st.session_state.workflow_history[-200:]
+            # In-memory history, capped as a circular buffer of the latest runs
+            history = st.session_state.get("workflow_history")
+            if not isinstance(history, deque):
+                history = deque(history or (), maxlen=_SESSION_HISTORY_MAX)
+                st.session_state.workflow_history = history
+            history.append(entry)
 
-            # Persist on disk alongside current session
-            session_id = st.session_state.get("current_session_id")
+            # Persist on disk alongside current session as an append-only JSONL log
             if session_id:
-                import os
-                os.makedirs("output/sessions", exist_ok=True)
-                session_path = f"output/sessions/{session_id}.json"
-                session_data = {}
-                try:
-                    if os.path.exists(session_path):
-                        with open(session_path, "r", encoding="utf-8") as f:
-                            session_data = json.load(f)
-                except Exception:
-                    session_data = {}
-
-                history_list = session_data.get("workflow_history", [])
-                history_list.append(entry)
-                if len(history_list) > 500:
-                    history_list = history_list[-500:]
-                session_data["workflow_history"] = history_list
-
-                try:
-                    with open(session_path, "w", encoding="utf-8") as f:
-                        json.dump(session_data, f, indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                _HISTORY_WRITER.submit(
+                    _write_workflow_history, f"{session_id}{WORKFLOW_HISTORY_SUFFIX}", entry, step_files
+                )
         except Exception:
             pass
 
     # ---------- UI helpers ----------
-    def _render_step_editor(self, step_idx: int, step: Dict[str, Any], available_tools: Dict[str, Dict[str, Any]], prior_steps: List[Dict[str, Any]]):
+    def _render_step_editor(self, step_idx: int, step: Dict[str, Any], available_tools: Dict[str, Dict[str, Any]], prior_steps: List[Dict[str, Any]],
+                            tool_options: List[str], tool_option_idx: Dict[str, int]):
         st.markdown(f"**Step {step_idx + 1}**")
         cols = st.columns([2, 1])
         with cols[0]:
             tool_name = st.selectbox(
                 "Tool",
-                options=[""] + list(available_tools.keys()),
-                index=(list(available_tools.keys()).index(step.get("tool")) + 1) if step.get("tool") in available_tools else 0,
+                options=tool_options,
+                index=tool_option_idx.get(step.get("tool"), 0),
                 key=f"wf_step_tool_{step_idx}"
             )
             step["tool"] = tool_name
@@ -237,7 +498,7 @@ class WorkflowsInterface:
                     )
                     # Try to parse JSON, otherwise keep as string
                     try:
-                        parsed_val = json.loads(val)
+                        parsed_val = _json_loads(val)
                     except Exception:
                         parsed_val = val
                     step["inputs"][pname] = {"type": "const", "value": parsed_val}
@@ -264,7 +525,7 @@ class WorkflowsInterface:
         st.markdown("# 🔗 Workflows")
         st.caption("Chain tools so outputs feed into subsequent inputs. Save and run workflows.")
 
-        all_tools = self.tools.load_all_tools()
+        all_tools = self._load_all_tools()
 
         tabs = st.tabs(["▶️ Run", "🛠️ Build / Edit", "📁 Manage"]) 
 
@@ -282,6 +543,7 @@ class WorkflowsInterface:
                             # Render input parameters if defined
                             top_inputs = wf_data.get("input_parameters", [])
                             user_params: Dict[str, Any] = {}
+                            file_params: List[str] = []
 
                             if top_inputs:
                                 st.markdown("### 📥 Inputs")
@@ -305,29 +567,21 @@ class WorkflowsInterface:
                                         elif ptype in ["array", "list"]:
                                             raw = st.text_area(label + " (JSON array)", placeholder=pdesc or "[1,2,3] or [\"a\",\"b\"]", key=f"wf_run_{pname}")
                                             try:
-                                                user_params[pname] = json.loads(raw) if raw.strip() else []
+                                                user_params[pname] = _json_loads(raw) if raw.strip() else []
                                             except Exception:
                                                 user_params[pname] = []
                                                 st.warning(f"Invalid JSON for {pname}; using empty list")
                                         elif ptype in ["object", "dict"]:
                                             raw = st.text_area(label + " (JSON)", placeholder=pdesc or '{"key":"value"}', key=f"wf_run_{pname}")
                                             try:
-                                                user_params[pname] = json.loads(raw) if raw.strip() else {}
+                                                user_params[pname] = _json_loads(raw) if raw.strip() else {}
                                             except Exception:
                                                 user_params[pname] = {}
                                                 st.warning(f"Invalid JSON for {pname}; using empty object")
                                         elif ptype == "file":
-                                            up = st.file_uploader(label, key=f"wf_run_{pname}")
-                                            if up is not None:
-                                                content = up.read()
-                                                user_params[pname] = {
-                                                    "name": up.name,
-                                                    "content": content,
-                                                    "type": up.type,
-                                                    "size": len(content)
-                                                }
-                                            else:
-                                                user_params[pname] = None
+                                            # Keep the upload handle; bytes are only pulled out on Execute
+                                            user_params[pname] = st.file_uploader(label, key=f"wf_run_{pname}")
+                                            file_params.append(pname)
                                         else:
                                             user_params[pname] = st.text_input(label, placeholder=pdesc, key=f"wf_run_{pname}")
 
@@ -338,6 +592,7 @@ class WorkflowsInterface:
                             if exec_clicked:
                                 with st.spinner(f"Executing workflow '{wf_name}'..."):
                                     _start = time.time()
+                                    _resolve_uploads(user_params, file_params)
                                     ok, step_results, final_str = self._execute_workflow(wf_data, user_params if top_inputs else None)
                                     if ok:
                                         st.success("Workflow executed")
@@ -348,16 +603,14 @@ class WorkflowsInterface:
                                         st.markdown("### 🧩 Final Output")
                                         # Try to align with output_parameters
                                         outs = wf_data.get("output_parameters", [])
-                                        if outs:
-                                            try:
-                                                parsed_final = json.loads(final_str or "{}")
-                                            except Exception:
-                                                parsed_final = {"result": final_str}
-                                            for p in outs:
-                                                oname = p.get("name")
-                                                if oname:
-                                                    st.markdown(f"**{oname}**")
-                                                    st.code(json.dumps(parsed_final.get(oname), indent=2) if isinstance(parsed_final.get(oname), (dict, list)) else str(parsed_final.get(oname)), language="json")
+                                        # The last step's output was already parsed (non-dicts wrapped) during execution
+                                        parsed_final = step_results[-1]
+                                        for p in outs:
+                                            oname = p.get("name")
+                                            if oname:
+                                                value = parsed_final.get(oname)
+                                                st.markdown(f"**{oname}**")
+                                                st.code(_json_dumps_indent(value) if isinstance(value, (dict, list)) else str(value), language="json")
                                         # if type(final_str) == str:
                                         # logger.info(f"Final str: {final_str} {type(final_str)}")
                                         # if isinstance(final_str, str):
@@ -365,12 +618,12 @@ class WorkflowsInterface:
                                         # else:
                                         st.json(parsed_final)
                                         # Record success
-                                        self._record_workflow_history(wf_name, wf_data, user_params if top_inputs else {}, True, final_str, _start, step_results)
+                                        self._record_workflow_history(wf_name, wf_data, _history_inputs(user_params, file_params), True, final_str, _start, step_results)
                                     else:
                                         st.error("Execution failed")
                                         st.text_area("Error", value=final_str or "", height=160, disabled=True)
                                         # Record failure
-                                        self._record_workflow_history(wf_name, wf_data, user_params if top_inputs else {}, False, final_str, _start, step_results)
+                                        self._record_workflow_history(wf_name, wf_data, _history_inputs(user_params, file_params), False, final_str, _start, step_results)
 
         # Build/Edit tab
         with tabs[1]:
@@ -380,6 +633,12 @@ class WorkflowsInterface:
                 name = st.text_input("Name", key="wf_name")
             with col2:
                 desc = st.text_area("Description", key="wf_desc", height=70)
+            parallel = st.checkbox(
+                "Run independent steps in parallel",
+                key="wf_parallel",
+                help="Steps that don't reference each other's outputs run at the same time. "
+                     "Leave off if a step relies on another's side effects (e.g. files it writes)."
+            )
             #     load_existing = st.selectbox("Load existing", options=[""] + self._list_workflows(), key="wf_load")
             #     if load_existing:
             #         data = self._load_workflow(load_existing) or {}
@@ -400,18 +659,21 @@ class WorkflowsInterface:
 
             # Render step editors
             if st.session_state.wf_steps:
-                for i in range(len(st.session_state.wf_steps)):
+                # Selectbox options and their positions, built once for every step editor
+                tool_options = [""] + list(all_tools)
+                tool_option_idx = {n: i for i, n in enumerate(tool_options) if n}
+                # Synthetic prior tool interface for outputs listing, grown by one entry per
+                # step after its editor runs (so a tool picked this rerun is already listed)
+                prior_defs: List[Dict[str, Any]] = []
+                for i, step in enumerate(st.session_state.wf_steps):
                     st.markdown("---")
-                    prior_defs = []
-                    # Build synthetic prior tool interface for outputs listing
-                    for j in range(i):
-                        step_tool = st.session_state.wf_steps[j].get("tool", "")
-                        cfg = all_tools.get(step_tool, {}) if step_tool else {}
-                        prior_defs.append({
-                            "name": step_tool,
-                            "output_parameters": cfg.get("output_parameters", [])
-                        })
-                    self._render_step_editor(i, st.session_state.wf_steps[i], all_tools, prior_defs)
+                    self._render_step_editor(i, step, all_tools, prior_defs, tool_options, tool_option_idx)
+                    step_tool = step.get("tool", "")
+                    cfg = all_tools.get(step_tool, {}) if step_tool else {}
+                    prior_defs.append({
+                        "name": step_tool,
+                        "output_parameters": cfg.get("output_parameters", [])
+                    })
             else:
                 st.info("No steps yet. Click 'Add Step'.")
 
@@ -422,6 +684,8 @@ class WorkflowsInterface:
                     "description": desc or st.session_state.get("wf_desc", ""),
                     "steps": st.session_state.wf_steps,
                 }
+                if parallel:
+                    data["parallel"] = True
                 if not data.get("name"):
                     st.error("Name is required")
                 else:
@@ -437,7 +701,11 @@ class WorkflowsInterface:
                 for wf in workflows:
                     wf_path = self.workflows_dir / f"{wf}.json"
                     with st.expander(f"📄 {wf}", expanded=False):
-                        st.code(wf_path.read_text(encoding="utf-8"), language="json")
+                        try:
+                            wf_text = _read_workflow_text(str(wf_path), wf_path.stat().st_mtime_ns)
+                        except FileNotFoundError:
+                            continue
+                        st.code(wf_text, language="json")
                         colA, colB = st.columns(2)
                         with colA:
                             if st.button("🗑️ Delete", key=f"wf_del_{wf}"):
@@ -450,7 +718,7 @@ class WorkflowsInterface:
                         with colB:
                             st.download_button(
                                 "⬇️ Download",
-                                data=wf_path.read_text(encoding="utf-8"),
+                                data=wf_text,
                                 file_name=f"{wf}.json",
                                 mime="application/json",
                                 key=f"wf_dl_{wf}"
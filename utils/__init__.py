@@ -5,20 +5,30 @@ Utility functions and helpers for the GenAI Agent.
 # Simple logger that works without external dependencies
 import logging
 import sys
+import threading
 from datetime import datetime
 
+_logger_lock = threading.Lock()
+
 # Simple logger setup
 def get_logger(name: str):
-    """Get a simple logger."""
+    """Get a simple logger; its handler is attached once, however often this is called.
+
+    Loggers that already have handlers (set up elsewhere) are returned untouched.
+    """
     logger = logging.getLogger(name)
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+    if getattr(logger, "_aiw_configured", False) or logger.handlers:
+        return logger
+    with _logger_lock:
+        if not getattr(logger, "_aiw_configured", False) and not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger._aiw_configured = True
     return logger
 
 def setup_logging(level: str = "INFO", directory: str = "output/logs"):
@@ -5,54 +5,252 @@ This module contains various utility functions for error handling,
 file operations, formatting, and other common tasks.
 """
 
+import asyncio
+import os
+import random
 import re
+import threading
 import time
+import uuid
 import functools
 import mimetypes
 from typing import Optional, Any, Callable, List, Dict
 from pathlib import Path
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
 
 from google.genai.errors import APIError
 from .logger import get_logger
+from .json_compat import orjson, json_has_long_ints, orjson_dumps_indented
+
+try:
+    import blake3
+except ImportError:  # blake3 is optional; only needed for algo="blake3"
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; only needed for algo="xxh3_128"
+    xxhash = None
 
 logger = get_logger(__name__)
 
-def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 2.0, exceptions: tuple = (Exception,)):
+# Bytes read per readinto() call when hashing files
+HASH_CHUNK_SIZE = 1024 * 1024
+# hash_files stays serial below this many files, or when no file reaches one chunk
+_PARALLEL_HASH_MIN_FILES = 4
+
+# Translation tables for sanitize_filename / clean_text_for_display
+_FN_TRANSLATE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_CTRL_CHAR_TRANSLATE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+# Units for format_file_size, one per power of 1024
+_SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+
+# USD per 1M tokens, from the models configuration (default for unknown models)
+_PRICING_MAP = {
+    "gemini-2.5-pro": {"input": 1.25, "output": 10.0},
+    "gemini-2.5-flash": {"input": 0.30, "output": 2.50},
+    "gemini-2.5-flash-lite": {"input": 0.10, "output": 0.40},
+    "gemini-2.0-flash": {"input": 0.10, "output": 0.40}
+}
+_DEFAULT_PRICING = {"input": 0.50, "output": 1.50}
+
+# Same prices as (input, output) USD per single token, used by estimate_cost
+_PRICE_PER_TOKEN = {
+    model: (p["input"] / 1_000_000, p["output"] / 1_000_000) for model, p in _PRICING_MAP.items()
+}
+_DEFAULT_PRICE_PER_TOKEN = (_DEFAULT_PRICING["input"] / 1_000_000, _DEFAULT_PRICING["output"] / 1_000_000)
+
+# Extensions recognised by is_image_file / is_video_file / is_audio_file
+_IMAGE_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp', 'tiff', 'svg'})
+_VIDEO_EXTENSIONS = frozenset({'mp4', 'avi', 'mov', 'wmv', 'flv', 'webm', 'mkv', '3gp'})
+_AUDIO_EXTENSIONS = frozenset({'mp3', 'wav', 'flac', 'aac', 'ogg', 'wma', 'm4a'})
+
+# URL pattern for validate_url, compiled once
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a function whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Shared fail-fast guard for calls to one backend.
+    
+    CLOSED: calls go through. After ``failure_threshold`` consecutive failures the
+    breaker goes OPEN and rejects calls until ``recovery_timeout`` seconds pass;
+    then it is HALF_OPEN and lets a single trial call through, which closes it on
+    success or re-opens it on failure.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+    
+    def allow(self) -> bool:
+        """Return True if a call may proceed now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._trial_in_flight = False
+            # HALF_OPEN: only one trial call at a time
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+    
+    def release(self) -> None:
+        """Give up a trial slot without judging the backend (e.g. a non-retryable error)."""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a backend (e.g. one per model name).
+    
+    Args:
+        name: Breaker key; separate names trip independently
+        failure_threshold: Consecutive failures before opening (first call only)
+        recovery_timeout: Seconds to stay open (first call only)
+        
+    Returns:
+        The CircuitBreaker registered under name
+    """
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(name)
+        if breaker is None:
+            breaker = _circuit_breakers[name] = CircuitBreaker(failure_threshold, recovery_timeout)
+        return breaker
+
+def retry_with_backoff(max_retries: int = 3, backoff_factor: float = 2.0, exceptions: tuple = (Exception,),
+                       max_delay: float = 60.0, jitter: bool = True,
+                       breaker: Optional[CircuitBreaker] = None):
     """
     Decorator to retry function calls with exponential backoff.
     
+    Works for both regular and ``async def`` functions; coroutines are awaited
+    and back off with ``asyncio.sleep`` so the event loop isn't blocked.
+    
     Args:
         max_retries: Maximum number of retry attempts
         backoff_factor: Multiplier for delay between retries
         exceptions: Tuple of exceptions to catch and retry
+        max_delay: Upper bound in seconds for any single delay
+        jitter: Sleep a random time up to the backoff delay ("full jitter")
+            so concurrent callers don't retry in lockstep
+        breaker: Optional shared CircuitBreaker; while it is open, calls fail
+            immediately with CircuitOpenError instead of being attempted
     
     Returns:
         Decorator function
     """
+    def backoff_delay(attempt: int) -> float:
+        delay = min(backoff_factor ** attempt, max_delay)
+        return random.uniform(0, delay) if jitter else delay
+    
+    def check_breaker(func: Callable) -> None:
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {func.__name__}; not calling it")
+    
+    def on_success() -> None:
+        if breaker is not None:
+            breaker.record_success()
+    
+    def on_other_error() -> None:
+        if breaker is not None:
+            breaker.release()
+    
+    def on_failure(func: Callable, attempt: int, e: Exception) -> float:
+        """Log the failed attempt and return the delay before the next one (re-raises on the last)."""
+        if breaker is not None:
+            breaker.record_failure()
+        if attempt == max_retries:
+            logger.error(f"Function {func.__name__} failed after {max_retries} retries: {str(e)}")
+            raise e
+        delay = backoff_delay(attempt)
+        logger.warning(f"Function {func.__name__} failed on attempt {attempt + 1}, retrying in {delay:.2f}s: {str(e)}")
+        return delay
+    
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_retries + 1):
+                    check_breaker(func)
+                    try:
+                        result = await func(*args, **kwargs)
+                    except exceptions as e:
+                        await asyncio.sleep(on_failure(func, attempt, e))
+                    except BaseException:
+                        on_other_error()
+                        raise
+                    else:
+                        on_success()
+                        return result
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            
             for attempt in range(max_retries + 1):
+                check_breaker(func)
                 try:
-                    return func(*args, **kwargs)
-                    
+                    result = func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries:
-                        logger.error(f"Function {func.__name__} failed after {max_retries} retries: {str(e)}")
-                        raise
-                    
-                    delay = backoff_factor ** attempt
-                    logger.warning(f"Function {func.__name__} failed on attempt {attempt + 1}, retrying in {delay}s: {str(e)}")
-                    time.sleep(delay)
-            
-            # This should never be reached, but just in case
-            raise last_exception
+                    time.sleep(on_failure(func, attempt, e))
+                except BaseException:
+                    on_other_error()
+                    raise
+                else:
+                    on_success()
+                    return result
             
         return wrapper
     return decorator
@@ -107,7 +305,7 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
         Sanitized filename
     """
     # Remove or replace unsafe characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_FN_TRANSLATE)
     
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
@@ -148,6 +346,24 @@ def estimate_tokens(text: str, model: str = "gemini") -> int:
         # Default estimation
         return len(text) // 4
 
+def estimate_tokens_batch(texts: List[str]):
+    """
+    Estimate token counts for many texts in one pass.
+    
+    Args:
+        texts: Texts to estimate tokens for (empty or None count as 0)
+        
+    Returns:
+        NumPy int64 array of estimated token counts, aligned with texts
+    """
+    # Imported here so modules using only the scalar helpers don't pay for NumPy at startup
+    import numpy as np
+    
+    lengths = np.fromiter((len(t) if t else 0 for t in texts), dtype=np.int64, count=len(texts))
+    # Same ~4 characters per token rule as estimate_tokens, for every model
+    return lengths // 4
+
+@functools.lru_cache(maxsize=1024)
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -161,14 +377,9 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
-    
-    return f"{size_bytes:.1f} {size_names[i]}"
+    # Unit index straight from the integer part's bit length (each unit is 2**10)
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_NAMES) - 1) if size_bytes >= 1024 else 0
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_NAMES[i]}"
 
 def validate_file_type(filename: str, allowed_types: List[str]) -> bool:
     """
@@ -184,9 +395,10 @@ def validate_file_type(filename: str, allowed_types: List[str]) -> bool:
     if not filename:
         return False
     
-    file_extension = Path(filename).suffix.lower().lstrip('.')
+    file_extension = get_file_extension(filename)
     return file_extension in [t.lower() for t in allowed_types]
 
+@functools.lru_cache(maxsize=4096)
 def get_file_mime_type(filename: str) -> Optional[str]:
     """
     Get MIME type for a file.
@@ -205,33 +417,95 @@ def generate_session_id() -> str:
     Generate a unique session ID.
     
     Returns:
-        Unique session ID string
+        Unique session ID string (32 hex characters, no dashes)
     """
-    import uuid
-    return str(uuid.uuid4())
+    return uuid.uuid4().hex
 
-def generate_file_hash(file_path: str) -> str:
+def _new_file_hasher(algo: str):
+    """Return a fresh hasher for algo.
+
+    Raises ImportError if algo's package isn't installed rather than quietly
+    substituting MD5, which would give digests that differ between installs.
+    """
+    if algo == "md5":
+        return hashlib.md5()
+    if algo == "blake3":
+        if blake3 is None:
+            raise ImportError("algo='blake3' requires the blake3 package")
+        return blake3.blake3()
+    if algo == "xxh3_128":
+        if xxhash is None:
+            raise ImportError("algo='xxh3_128' requires the xxhash package")
+        return xxhash.xxh3_128()
+    raise ValueError(f"Unsupported hash algorithm: {algo}")
+
+def generate_file_hash(file_path: str, algo: str = "md5") -> str:
     """
-    Generate MD5 hash for a file.
+    Generate a content hash for a file.
     
     Args:
         file_path: Path to the file
+        algo: "md5" (default), or the faster "blake3" / "xxh3_128", which
+            need those packages installed
         
     Returns:
-        MD5 hash string
+        Hex digest string
+        
+    Raises:
+        ImportError: If algo's package is not installed
+        ValueError: If algo is not supported
     """
-    hash_md5 = hashlib.md5()
+    hasher = _new_file_hasher(algo)
     
     try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+        # One reusable buffer; unbuffered reads since we already read in large chunks
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                hasher.update(view[:n])
+        return hasher.hexdigest()
     
     except Exception as e:
         logger.error(f"Error generating file hash: {str(e)}")
         return ""
 
+def _file_size(path: Path) -> int:
+    """Size of path in bytes, or 0 if it can't be stat'ed."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+def hash_files(paths: List[Path], algo: str = "md5", max_workers: Optional[int] = None) -> Dict[Path, str]:
+    """
+    Hash many files, concurrently when that pays off.
+    
+    Small batches, and batches where every file is under HASH_CHUNK_SIZE, are
+    hashed serially since thread overhead outweighs the overlapped I/O there.
+    
+    Args:
+        paths: Files to hash
+        algo: Hash algorithm, as for generate_file_hash
+        max_workers: Upper bound on concurrent reads (defaults to the CPU count)
+        
+    Returns:
+        Mapping of path to hex digest ("" for files that could not be read)
+    """
+    paths = list(paths)
+    # Fail once, up front, on an unsupported or unavailable algo
+    _new_file_hasher(algo)
+    if len(paths) < _PARALLEL_HASH_MIN_FILES or all(_file_size(p) < HASH_CHUNK_SIZE for p in paths):
+        return {p: generate_file_hash(p, algo) for p in paths}
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    # File reads and hashlib/blake3 updates release the GIL, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = pool.map(lambda p: generate_file_hash(p, algo), paths)
+        return dict(zip(paths, digests))
+
 def truncate_text(text: str, max_length: int = 200, add_ellipsis: bool = True) -> str:
     """
     Truncate text to specified length.
@@ -254,6 +528,7 @@ def truncate_text(text: str, max_length: int = 200, add_ellipsis: bool = True) -
     
     return truncated
 
+@functools.lru_cache(maxsize=1024)
 def format_duration(seconds: float) -> str:
     """
     Format duration in human-readable format.
@@ -311,6 +586,7 @@ def parse_model_config(config_string: str) -> Dict[str, Any]:
         logger.error(f"Invalid value in model config: {str(e)}")
         return {}
 
+@functools.lru_cache(maxsize=1024)
 def format_token_count(count: int) -> str:
     """
     Format token count in human-readable format.
@@ -340,25 +616,10 @@ def estimate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
     Returns:
         Estimated cost in USD
     """
-    # Pricing from the models configuration
-    pricing_map = {
-        "gemini-2.5-pro": {"input": 1.25, "output": 10.0},
-        "gemini-2.5-flash": {"input": 0.30, "output": 2.50},
-        "gemini-2.5-flash-lite": {"input": 0.10, "output": 0.40},
-        "gemini-2.0-flash": {"input": 0.10, "output": 0.40}
-    }
-    
-    # Default pricing if model not found
-    default_pricing = {"input": 0.50, "output": 1.50}
-    
-    pricing = pricing_map.get(model, default_pricing)
-    
-    # Calculate cost per 1M tokens
-    input_cost = (input_tokens / 1_000_000) * pricing["input"]
-    output_cost = (output_tokens / 1_000_000) * pricing["output"]
-    
-    return input_cost + output_cost
+    input_rate, output_rate = _PRICE_PER_TOKEN.get(model, _DEFAULT_PRICE_PER_TOKEN)
+    return input_tokens * input_rate + output_tokens * output_rate
 
+@functools.lru_cache(maxsize=1024)
 def format_cost(cost: float) -> str:
     """
     Format cost in human-readable format.
@@ -387,6 +648,12 @@ def safe_json_loads(json_string: str, default: Any = None) -> Any:
     Returns:
         Parsed JSON or default value
     """
+    if orjson is not None and isinstance(json_string, (str, bytes)) and not json_has_long_ints(json_string):
+        try:
+            return orjson.loads(json_string)
+        except (orjson.JSONDecodeError, TypeError):
+            # orjson is stricter (e.g. NaN); let the stdlib parser decide
+            pass
     try:
         return json.loads(json_string)
     except (json.JSONDecodeError, TypeError):
@@ -403,6 +670,10 @@ def safe_json_dumps(obj: Any, default: str = "{}") -> str:
     Returns:
         JSON string or default value
     """
+    # orjson is used only where json.dumps would accept obj and write the same values
+    payload = orjson_dumps_indented(obj)
+    if payload is not None:
+        return payload.decode("utf-8")
     try:
         return json.dumps(obj, indent=2, ensure_ascii=False)
     except (TypeError, ValueError):
@@ -422,8 +693,7 @@ def clean_text_for_display(text: str) -> str:
         return ""
     
     # Remove or replace potentially problematic characters
-    text = text.replace('\x00', '')  # Remove null bytes
-    text = re.sub(r'[\x01-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)  # Remove control chars
+    text = text.translate(_CTRL_CHAR_TRANSLATE)  # Remove null bytes and control chars
     
     return text
 
@@ -437,16 +707,16 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url))
+    # Cheap structural rejects first; the full pattern only runs on plausible http(s) URLs
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return False
+    return bool(_URL_RE.match(url))
 
+@functools.lru_cache(maxsize=4096)
 def get_file_extension(filename: str) -> str:
     """
     Get file extension from filename.
@@ -469,8 +739,7 @@ def is_image_file(filename: str) -> bool:
     Returns:
         True if file is an image
     """
-    image_extensions = {'jpg', 'jpeg', 'png', 'gif', 'webp', 'bmp', 'tiff', 'svg'}
-    return get_file_extension(filename) in image_extensions
+    return get_file_extension(filename) in _IMAGE_EXTENSIONS
 
 def is_video_file(filename: str) -> bool:
     """
@@ -482,8 +751,7 @@ def is_video_file(filename: str) -> bool:
     Returns:
         True if file is a video
     """
-    video_extensions = {'mp4', 'avi', 'mov', 'wmv', 'flv', 'webm', 'mkv', '3gp'}
-    return get_file_extension(filename) in video_extensions
+    return get_file_extension(filename) in _VIDEO_EXTENSIONS
 
 def is_audio_file(filename: str) -> bool:
     """
@@ -495,8 +763,7 @@ def is_audio_file(filename: str) -> bool:
     Returns:
         True if file is an audio file
     """
-    audio_extensions = {'mp3', 'wav', 'flac', 'aac', 'ogg', 'wma', 'm4a'}
-    return get_file_extension(filename) in audio_extensions
+    return get_file_extension(filename) in _AUDIO_EXTENSIONS
 
 def get_system_info() -> Dict[str, Any]:
     """
@@ -0,0 +1,72 @@
+"""
+Optional orjson fast paths that keep the stdlib json module's results.
+
+orjson differs from json in a few ways that matter here: it reads integers
+beyond 64 bits as floats, writes NaN/Infinity as null, and encodes types the
+stdlib refuses (datetime, UUID, dataclasses, Enum, numpy). Callers use orjson
+only when these helpers say the outcome is the same, and json otherwise.
+"""
+
+import math
+import re
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; callers fall back to the stdlib json module
+    orjson = None
+
+# orjson parses integers beyond 64 bits as lossy floats; text with a run of 19+
+# digits anywhere goes to the stdlib parser instead (a false positive only costs speed)
+_LONG_DIGITS_RE = re.compile(r"[0-9]{19,}")
+_LONG_DIGITS_RE_BYTES = re.compile(rb"[0-9]{19,}")
+
+
+def json_has_long_ints(text: Any) -> bool:
+    """True if JSON text (str or bytes) may hold an integer orjson would read as a float."""
+    if isinstance(text, str):
+        return _LONG_DIGITS_RE.search(text) is not None
+    return _LONG_DIGITS_RE_BYTES.search(text) is not None
+
+
+def json_stdlib_native(obj: Any) -> bool:
+    """True if obj holds only values json.dumps writes natively, with no NaN or infinity.
+
+    Dict keys may be str, int, float, bool or None, as json.dumps allows.
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (str, int)) or item is None:
+            continue
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif isinstance(item, dict):
+            for key in item:
+                if not (isinstance(key, (str, int, float)) or key is None):
+                    return False
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        else:
+            return False
+    return True
+
+
+def _reject(obj: Any) -> Any:
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def orjson_dumps_indented(obj: Any) -> Optional[bytes]:
+    """obj as 2-space indented JSON from orjson, or None when json.dumps must decide.
+
+    None covers a missing orjson, values json.dumps would write differently or
+    refuse, subclasses orjson does not encode natively, and ints beyond 64 bits.
+    """
+    if orjson is None or not json_stdlib_native(obj):
+        return None
+    try:
+        return orjson.dumps(obj, default=_reject, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return None
@@ -7,8 +7,18 @@ Provides a unified API to manage files and folders under logical roots:
 
 import os
 import json
+import stat
+import tempfile
+import fnmatch
+import mmap
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, IO, Optional, List, Tuple
+
+from .json_compat import orjson, json_has_long_ints, orjson_dumps_indented
+
+# read_text memory-maps files at least this large instead of reading them into a buffer
+_MMAP_READ_THRESHOLD = 1024 * 1024
 
 
 class StoragePaths:
@@ -27,16 +37,24 @@ class StoragePaths:
         "@output": Path("output"),
     }
 
+    # Resolved absolute base per (root path, working directory); roots are relative paths
+    _RESOLVED_BASES: Dict[Tuple[Path, str], Path] = {}
+
     @classmethod
     def resolve(cls, logical_root: str, *relative_parts: str) -> Path:
         base = cls.ROOT_MAP.get(logical_root)
         if base is None:
             raise ValueError(f"Unknown logical root: {logical_root}")
+        if not relative_parts:
+            return base
         candidate = base.joinpath(*relative_parts)
         # Prevent path traversal escaping the base
-        base_abs = base.resolve()
+        key = (base, os.getcwd())
+        base_abs = cls._RESOLVED_BASES.get(key)
+        if base_abs is None:
+            base_abs = cls._RESOLVED_BASES.setdefault(key, base.resolve())
         candidate_abs = candidate.resolve(strict=False)
-        if not str(candidate_abs).startswith(str(base_abs)):
+        if not candidate_abs.is_relative_to(base_abs):
             raise ValueError("Path traversal attempt detected")
         return candidate
 
@@ -48,7 +66,18 @@ def ensure_dir(path: Path) -> None:
 def list_files(logical_root: str, pattern: str = "*") -> List[Path]:
     base = StoragePaths.resolve(logical_root)
     ensure_dir(base)
-    return sorted([p for p in base.glob(pattern) if p.is_file()], key=lambda p: p.name)
+    if "/" in pattern or os.sep in pattern or "**" in pattern:
+        # Patterns reaching into subdirectories still need glob
+        return sorted([p for p in base.glob(pattern) if p.is_file()], key=lambda p: p.name)
+    # Flat patterns: scandir's cached entry types avoid a stat per file
+    match_all = pattern == "*"
+    with os.scandir(base) as it:
+        files = [
+            base / entry.name for entry in it
+            if (match_all or fnmatch.fnmatch(entry.name, pattern)) and entry.is_file()
+        ]
+    files.sort(key=lambda p: p.name)
+    return files
 
 
 def list_dirs(logical_root: str) -> List[Path]:
@@ -57,10 +86,28 @@ def list_dirs(logical_root: str) -> List[Path]:
     return sorted([p for p in base.iterdir() if p.is_dir()], key=lambda p: p.name)
 
 
+def _read_text_mmap(path: Path) -> str:
+    """Decode a file from a read-only memory map, with read_text's newline handling."""
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, "utf-8")
+    if "\r" in text:
+        # Match text-mode universal newlines
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def read_text(logical_root: str, relative_path: str, default: Optional[str] = None) -> Optional[str]:
     path = StoragePaths.resolve(logical_root, relative_path)
     if not path.exists() or not path.is_file():
         return default
+    if path.stat().st_size >= _MMAP_READ_THRESHOLD:
+        try:
+            return _read_text_mmap(path)
+        except UnicodeDecodeError:
+            raise
+        except (OSError, ValueError):
+            # Not mappable (e.g. special files); the regular read below still works
+            pass
     return path.read_text(encoding="utf-8")
 
 
@@ -72,17 +119,96 @@ def write_text(logical_root: str, relative_path: str, content: str) -> bool:
 
 
 def read_json(logical_root: str, relative_path: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-    text = read_text(logical_root, relative_path)
-    if text is None:
+    path = StoragePaths.resolve(logical_root, relative_path)
+    if not path.exists() or not path.is_file():
         return default
+    raw = path.read_bytes()
+    if orjson is not None and not json_has_long_ints(raw):
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            # orjson is stricter (e.g. NaN); let the stdlib parser decide
+            pass
     try:
-        return json.loads(text)
+        return json.loads(raw.decode("utf-8"))
     except Exception:
         return default
 
 
+def _write_beside(path: Path, write: Callable[[IO], Any], binary: bool = False) -> None:
+    """Write path through a uniquely named sibling temp file, swapped in with os.replace.
+
+    A crash or error midway leaves the old file intact, and concurrent writers
+    never share (or delete) each other's temp file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8")) as f:
+            write(f)
+        # mkstemp creates the file 0600; keep the replaced file's mode
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def write_json(logical_root: str, relative_path: str, data: Dict[str, Any]) -> bool:
-    return write_text(logical_root, relative_path, json.dumps(data, indent=2, ensure_ascii=False))
+    path = StoragePaths.resolve(logical_root, relative_path)
+    ensure_dir(path.parent)
+    # None when the stdlib must decide (no orjson, or values orjson would write differently)
+    payload = orjson_dumps_indented(data)
+    if payload is not None:
+        _write_beside(path, lambda f: f.write(payload), binary=True)
+    else:
+        # Stream rather than building the whole document as one string
+        _write_beside(path, lambda f: json.dump(data, f, indent=2, ensure_ascii=False))
+    return True
+
+
+def append_jsonl(logical_root: str, relative_path: str, record: Dict[str, Any]) -> bool:
+    path = StoragePaths.resolve(logical_root, relative_path)
+    ensure_dir(path.parent)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return True
+
+
+def read_jsonl(logical_root: str, relative_path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    path = StoragePaths.resolve(logical_root, relative_path)
+    if not path.exists() or not path.is_file():
+        return []
+    with path.open("r", encoding="utf-8") as f:
+        lines = deque(f, maxlen=limit) if limit else list(f)
+    records = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(json.loads(line))
+        except Exception:
+            # Skip a partially written trailing line
+            continue
+    return records
+
+
+def trim_jsonl(logical_root: str, relative_path: str, keep: int) -> bool:
+    path = StoragePaths.resolve(logical_root, relative_path)
+    if not path.exists() or not path.is_file():
+        return True
+    with path.open("r", encoding="utf-8") as f:
+        tail = deque(f, maxlen=keep)
+    # Swap the kept tail in, so a crash never leaves a truncated file
+    _write_beside(path, lambda f: f.writelines(tail))
+    return True
 
 
 def delete_path(logical_root: str, relative_path: str) -> bool:
@@ -91,27 +217,28 @@ def delete_path(logical_root: str, relative_path: str) -> bool:
         return True
     if path.is_dir():
         # Only allow deleting empty directories to avoid accidental data loss
-        try:
-            next(path.iterdir())
-            return False
-        except StopIteration:
-            path.rmdir()
-            return True
+        with os.scandir(path) as it:
+            if next(it, None) is not None:
+                return False
+        os.rmdir(path)
+        return True
     else:
-        path.unlink()
+        os.unlink(path)
         return True
 
 
 def ensure_empty_dir(logical_root: str, *relative_parts: str) -> Path:
     path = StoragePaths.resolve(logical_root, *relative_parts)
     ensure_dir(path)
-    # Remove files inside (not subdirs) for a clean export/temp workflow
-    for item in path.iterdir():
-        if item.is_file():
-            try:
-                item.unlink()
-            except Exception:
-                pass
+    # Remove files inside (not subdirs) for a clean export/temp workflow;
+    # scandir's cached entry types save a stat per file
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file():
+                try:
+                    os.unlink(entry.path)
+                except Exception:
+                    pass
     return path
 
 
@@ -132,3 +259,25 @@ def file_info(logical_root: str, relative_path: str) -> Optional[Dict[str, Any]]
     }
 
 
+
+
+def list_file_infos(logical_root: str) -> List[Dict[str, Any]]:
+    """file_info for every entry directly under a root, with one stat per entry."""
+    base = StoragePaths.resolve(logical_root)
+    ensure_dir(base)
+    infos = []
+    with os.scandir(base) as it:
+        for entry in it:
+            try:
+                st = entry.stat()
+            except OSError:
+                # Entry vanished (or is a dangling link) since the directory was read
+                continue
+            infos.append({
+                "name": entry.name,
+                "size": st.st_size,
+                "path": str(base / entry.name),
+                "is_dir": entry.is_dir(),
+            })
+    infos.sort(key=lambda info: info["name"])
+    return infos
@@ -7,13 +7,74 @@ API configurations, and other data to ensure security and correctness.
 
 import re
 import os
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+import string
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from pathlib import Path
 
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Whitelists for the identifier validators, as str.translate tables that delete every
+# allowed character: a value is valid when nothing is left over
+_ID_CHARS = string.ascii_letters + string.digits + '_-'
+_API_KEY_STRIP = dict.fromkeys(map(ord, _ID_CHARS))
+_SESSION_ID_STRIP = _API_KEY_STRIP
+_MODEL_NAME_STRIP = dict.fromkeys(map(ord, _ID_CHARS + '.'))
+# Tool names are checked on their ASCII bytes: bytes.translate(None, delete) drops
+# the listed bytes with a C table lookup per byte
+_TOOL_NAME_FIRST_BYTES = string.ascii_letters.encode('ascii')
+_TOOL_NAME_BYTES = (string.ascii_letters + string.digits + '_').encode('ascii')
+
+def _as_float(value: Any) -> float:
+    """float(value), skipping the conversion for values that already are floats."""
+    return value if type(value) is float else float(value)
+
+def _as_int(value: Any) -> int:
+    """int(value), skipping the conversion for values that already are ints (bools are converted)."""
+    return value if type(value) is int else int(value)
+
+# validate_model_config's numeric fields: (key, cast, min, max, range error, None skips the field)
+_MODEL_FIELDS = (
+    ('temperature', _as_float, 0.0, 2.0, "Temperature must be between 0.0 and 2.0", False),
+    ('max_tokens', _as_int, 1, 2000000, "Max tokens must be between 1 and 2,000,000", False),
+    ('top_p', _as_float, 0.0, 1.0, "Top-p must be between 0.0 and 1.0", False),
+    ('top_k', _as_int, 1, 100, "Top-k must be between 1 and 100", False),
+    ('thinking_budget', _as_int, 0, 50000, "Thinking budget must be between 0 and 50,000", True),
+)
+
+# Substrings that mark an upload name as potentially sensitive, matched in one pass
+_DANGEROUS_NAME_RE = re.compile('|'.join(map(re.escape, ['.env', 'config', 'secret', 'key', '.git', '.ssh'])))
+
+# Accepted generation options; tuples keep the order used in error messages
+_IMAGE_RATIOS = ('1:1', '3:4', '4:3', '9:16', '16:9')
+_IMAGE_RATIO_SET = frozenset(_IMAGE_RATIOS)
+_IMAGE_MIMES = ('image/jpeg', 'image/png', 'image/webp')
+_IMAGE_MIME_SET = frozenset(_IMAGE_MIMES)
+_VIDEO_RATIOS = ('16:9', '9:16')
+_VIDEO_RATIO_SET = frozenset(_VIDEO_RATIOS)
+
+# Names validate_tool_name rejects (compared lower-cased)
+_RESERVED_WORDS = frozenset({'def', 'class', 'if', 'else', 'while', 'for', 'import', 'return'})
+
+# validate_json_schema's JSON type names and the Python types they accept
+_SCHEMA_TYPES = {
+    'object': dict,
+    'array': list,
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+}
+
+# validate_prompt's length limit (1M characters)
+_MAX_PROMPT_CHARS = 1000000
+
+# Code points sanitize_input deletes: null, C0 controls except \t \n \r, and DEL
+_SANITIZE_DELETE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
 def validate_api_key(api_key: str) -> Tuple[bool, str]:
     """
     Validate Google API key format.
@@ -40,12 +101,12 @@ def validate_api_key(api_key: str) -> Tuple[bool, str]:
         return False, "API key is too long"
     
     # Check for valid characters (alphanumeric, dashes, underscores)
-    if not re.match(r'^[A-Za-z0-9_-]+$', api_key):
+    if api_key.translate(_API_KEY_STRIP):
         return False, "API key contains invalid characters"
     
     # Google API keys typically start with specific patterns
     # This is a basic check and may need adjustment
-    if not (api_key.startswith('AI') or api_key.startswith('ya29')):
+    if not api_key.startswith(('AI', 'ya29')):
         logger.warning("API key format may not be standard for Google APIs")
     
     return True, ""
@@ -63,41 +124,16 @@ def validate_model_config(config: Dict[str, Any]) -> Tuple[bool, str, Dict[str,
     sanitized_config = {}
     
     try:
-        # Temperature validation
-        if 'temperature' in config:
-            temp = float(config['temperature'])
-            if not 0.0 <= temp <= 2.0:
-                return False, "Temperature must be between 0.0 and 2.0", {}
-            sanitized_config['temperature'] = temp
-        
-        # Max tokens validation
-        if 'max_tokens' in config:
-            max_tokens = int(config['max_tokens'])
-            if not 1 <= max_tokens <= 2000000:
-                return False, "Max tokens must be between 1 and 2,000,000", {}
-            sanitized_config['max_tokens'] = max_tokens
-        
-        # Top-p validation
-        if 'top_p' in config:
-            top_p = float(config['top_p'])
-            if not 0.0 <= top_p <= 1.0:
-                return False, "Top-p must be between 0.0 and 1.0", {}
-            sanitized_config['top_p'] = top_p
-        
-        # Top-k validation
-        if 'top_k' in config:
-            top_k = int(config['top_k'])
-            if not 1 <= top_k <= 100:
-                return False, "Top-k must be between 1 and 100", {}
-            sanitized_config['top_k'] = top_k
-        
-        # Thinking budget validation
-        if 'thinking_budget' in config:
-            if config['thinking_budget'] is not None:
-                thinking_budget = int(config['thinking_budget'])
-                if not 0 <= thinking_budget <= 50000:
-                    return False, "Thinking budget must be between 0 and 50,000", {}
-                sanitized_config['thinking_budget'] = thinking_budget
+        # Numeric fields: cast, then range-check against _MODEL_FIELDS
+        for key, cast, lo, hi, message, none_ok in _MODEL_FIELDS:
+            if key in config:
+                raw = config[key]
+                if raw is None and none_ok:
+                    continue
+                value = cast(raw)
+                if not lo <= value <= hi:
+                    return False, message, {}
+                sanitized_config[key] = value
         
         # System instruction validation
         if 'system_instruction' in config:
@@ -126,6 +162,23 @@ def validate_model_config(config: Dict[str, Any]) -> Tuple[bool, str, Dict[str,
     except (ValueError, TypeError) as e:
         return False, f"Invalid configuration value: {str(e)}", {}
 
+@dataclass(frozen=True)
+class UploadPolicy:
+    """Upload rules prepared once and reused across validate_file_upload_policy calls."""
+    allowed_types: Tuple[str, ...]
+    max_size_mb: float = 100
+    allowed_ext: FrozenSet[str] = field(init=False, repr=False)
+    max_bytes: float = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        allowed_types = self.allowed_types
+        # Sequences keep the caller's order for error messages; sets have none, so sort them
+        if isinstance(allowed_types, (set, frozenset)):
+            allowed_types = sorted(allowed_types)
+        object.__setattr__(self, 'allowed_types', tuple(allowed_types))
+        object.__setattr__(self, 'allowed_ext', frozenset(t.lower() for t in allowed_types))
+        object.__setattr__(self, 'max_bytes', self.max_size_mb * (1024 * 1024))
+
 def validate_file_upload(
     file_path: str,
     allowed_types: List[str],
@@ -136,31 +189,47 @@ def validate_file_upload(
     
     Args:
         file_path: Path to the uploaded file
-        allowed_types: List of allowed file extensions
+        allowed_types: Allowed file extensions (matched case-insensitively)
         max_size_mb: Maximum file size in MB
         
     Returns:
         Tuple of (is_valid, error_message)
     """
-    file_path = Path(file_path)
+    return validate_file_upload_policy(file_path, UploadPolicy(allowed_types, max_size_mb))
+
+def validate_file_upload_policy(file_path: str, policy: UploadPolicy) -> Tuple[bool, str]:
+    """
+    Validate a file upload against a prepared UploadPolicy.
     
-    # Check if file exists
-    if not file_path.exists():
+    Args:
+        file_path: Path to the uploaded file
+        policy: Allowed types and size limit, built once by the caller
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    file_path = os.fspath(file_path)
+    
+    # Check if file exists (the one stat also supplies the size below)
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         return False, "File does not exist"
     
-    # Check file extension
-    file_extension = file_path.suffix.lower().lstrip('.')
-    if file_extension not in [t.lower() for t in allowed_types]:
-        return False, f"File type '{file_extension}' not allowed. Allowed types: {', '.join(allowed_types)}"
+    # Check file extension (same rules as Path.suffix, without building a Path)
+    name = os.path.basename(file_path.rstrip("/" + os.sep))
+    dot = name.rfind('.')
+    file_extension = name[dot + 1:].lower() if 0 < dot < len(name) - 1 else ''
+    if file_extension not in policy.allowed_ext:
+        return False, f"File type '{file_extension}' not allowed. Allowed types: {', '.join(policy.allowed_types)}"
     
     # Check file size
-    file_size_mb = file_path.stat().st_size / (1024 * 1024)
-    if file_size_mb > max_size_mb:
-        return False, f"File size ({file_size_mb:.1f}MB) exceeds maximum allowed size ({max_size_mb}MB)"
+    if st.st_size > policy.max_bytes:
+        file_size_mb = st.st_size / (1024 * 1024)
+        return False, f"File size ({file_size_mb:.1f}MB) exceeds maximum allowed size ({policy.max_size_mb}MB)"
     
     # Check for potentially dangerous file names
-    dangerous_names = ['.env', 'config', 'secret', 'key', '.git', '.ssh']
-    if any(dangerous in file_path.name.lower() for dangerous in dangerous_names):
+    if _DANGEROUS_NAME_RE.search(name.lower()):
         return False, "File name contains potentially sensitive information"
     
     return True, ""
@@ -180,13 +249,12 @@ def sanitize_input(text: str, max_length: int = 100000) -> str:
         text = str(text)
     
     # Remove null bytes and control characters
-    text = text.replace('\x00', '')
-    text = re.sub(r'[\x01-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_SANITIZE_DELETE)
     
     # Limit length
     if len(text) > max_length:
         text = text[:max_length]
-        logger.warning(f"Input text truncated to {max_length} characters")
+        logger.warning("Input text truncated to %d characters", max_length)
     
     return text
 
@@ -200,15 +268,12 @@ def validate_session_id(session_id: str) -> bool:
     Returns:
         True if valid
     """
-    if not session_id or not isinstance(session_id, str):
+    # Type and reasonable length limits (the lower bound also rejects empty values)
+    if not isinstance(session_id, str) or not 3 <= len(session_id) <= 50:
         return False
     
     # Allow alphanumeric, hyphens, and underscores
-    if not re.match(r'^[A-Za-z0-9_-]+$', session_id):
-        return False
-    
-    # Reasonable length limits
-    if not 3 <= len(session_id) <= 50:
+    if session_id.translate(_SESSION_ID_STRIP):
         return False
     
     return True
@@ -223,15 +288,12 @@ def validate_model_name(model_name: str) -> bool:
     Returns:
         True if valid
     """
-    if not model_name or not isinstance(model_name, str):
+    # Type and reasonable length limits (the lower bound also rejects empty values)
+    if not isinstance(model_name, str) or not 3 <= len(model_name) <= 100:
         return False
     
     # Allow alphanumeric, hyphens, underscores, and dots
-    if not re.match(r'^[A-Za-z0-9._-]+$', model_name):
-        return False
-    
-    # Reasonable length limits
-    if not 3 <= len(model_name) <= 100:
+    if model_name.translate(_MODEL_NAME_STRIP):
         return False
     
     return True
@@ -252,16 +314,46 @@ def validate_prompt(prompt: str) -> Tuple[bool, str]:
     if not isinstance(prompt, str):
         return False, "Prompt must be text"
     
-    # Check length
-    if len(prompt) > 1000000:  # 1M characters
+    # Check length first: it's O(1), and rejects oversized prompts before any scan
+    if len(prompt) > _MAX_PROMPT_CHARS:
         return False, "Prompt is too long (max 1M characters)"
     
     # Check for potentially problematic content
-    if '\x00' in prompt:
+    if prompt.find('\x00') >= 0:
         return False, "Prompt contains null bytes"
     
     return True, ""
 
+def validate_and_sanitize_prompt(prompt: str) -> Tuple[bool, str, str]:
+    """
+    Validate a prompt and strip control characters in one pass.
+    
+    Otherwise matches validate_prompt followed by sanitize_input(prompt,
+    max_length=1_000_000), except that null bytes are removed along with the
+    other control characters rather than rejected, and a prompt left empty
+    by that removal is rejected.
+    
+    Args:
+        prompt: Prompt text to validate
+        
+    Returns:
+        Tuple of (is_valid, error_message, sanitized_prompt)
+    """
+    if not prompt:
+        return False, "Prompt cannot be empty", ""
+    
+    if not isinstance(prompt, str):
+        return False, "Prompt must be text", ""
+    
+    if len(prompt) > _MAX_PROMPT_CHARS:
+        return False, "Prompt is too long (max 1M characters)", ""
+    
+    cleaned = prompt.translate(_SANITIZE_DELETE)
+    if not cleaned:
+        return False, "Prompt cannot be empty", ""
+    
+    return True, "", cleaned
+
 def validate_image_config(config: Dict[str, Any]) -> Tuple[bool, str, Dict[str, Any]]:
     """
     Validate image generation configuration.
@@ -285,17 +377,15 @@ def validate_image_config(config: Dict[str, Any]) -> Tuple[bool, str, Dict[str,
         # Aspect ratio
         if 'aspect_ratio' in config:
             aspect_ratio = str(config['aspect_ratio'])
-            valid_ratios = ['1:1', '3:4', '4:3', '9:16', '16:9']
-            if aspect_ratio not in valid_ratios:
-                return False, f"Aspect ratio must be one of: {', '.join(valid_ratios)}", {}
+            if aspect_ratio not in _IMAGE_RATIO_SET:
+                return False, f"Aspect ratio must be one of: {', '.join(_IMAGE_RATIOS)}", {}
             sanitized_config['aspect_ratio'] = aspect_ratio
         
         # Output format
         if 'output_mime_type' in config:
             mime_type = str(config['output_mime_type'])
-            valid_types = ['image/jpeg', 'image/png', 'image/webp']
-            if mime_type not in valid_types:
-                return False, f"Output MIME type must be one of: {', '.join(valid_types)}", {}
+            if mime_type not in _IMAGE_MIME_SET:
+                return False, f"Output MIME type must be one of: {', '.join(_IMAGE_MIMES)}", {}
             sanitized_config['output_mime_type'] = mime_type
         
         return True, "", sanitized_config
@@ -333,9 +423,8 @@ def validate_video_config(config: Dict[str, Any]) -> Tuple[bool, str, Dict[str,
         # Aspect ratio
         if 'aspect_ratio' in config:
             aspect_ratio = str(config['aspect_ratio'])
-            valid_ratios = ['16:9', '9:16']
-            if aspect_ratio not in valid_ratios:
-                return False, f"Video aspect ratio must be one of: {', '.join(valid_ratios)}", {}
+            if aspect_ratio not in _VIDEO_RATIO_SET:
+                return False, f"Video aspect ratio must be one of: {', '.join(_VIDEO_RATIOS)}", {}
             sanitized_config['aspect_ratio'] = aspect_ratio
         
         return True, "", sanitized_config
@@ -399,19 +488,14 @@ def validate_json_schema(data: Any, schema: Dict[str, Any]) -> Tuple[bool, str]:
         # Basic type checking
         if 'type' in schema:
             expected_type = schema['type']
-            
-            if expected_type == 'object' and not isinstance(data, dict):
-                return False, "Expected object"
-            elif expected_type == 'array' and not isinstance(data, list):
-                return False, "Expected array"
-            elif expected_type == 'string' and not isinstance(data, str):
-                return False, "Expected string"
-            elif expected_type == 'number' and not isinstance(data, (int, float)):
-                return False, "Expected number"
-            elif expected_type == 'integer' and not isinstance(data, int):
-                return False, "Expected integer"
-            elif expected_type == 'boolean' and not isinstance(data, bool):
-                return False, "Expected boolean"
+            # Unknown or non-string types (e.g. ['string', 'null']) aren't checked, as before
+            python_type = _SCHEMA_TYPES.get(expected_type) if isinstance(expected_type, str) else None
+            if python_type is not None:
+                # bool is an int subclass, but JSON booleans are not numbers
+                if not isinstance(data, python_type) or (
+                    isinstance(data, bool) and expected_type in ('number', 'integer')
+                ):
+                    return False, f"Expected {expected_type}"
         
         # Required properties for objects
         if isinstance(data, dict) and 'required' in schema:
@@ -437,20 +521,25 @@ def sanitize_file_path(file_path: str, base_directory: str) -> Optional[str]:
     """
     try:
         # Normalize paths
-        base_path = Path(base_directory).resolve()
+        base_path = _resolve_base(base_directory, os.getcwd())
         full_path = (base_path / file_path).resolve()
         
         # Check that the file is within the base directory
-        if not str(full_path).startswith(str(base_path)):
-            logger.warning(f"Path traversal attempt detected: {file_path}")
+        if not full_path.is_relative_to(base_path):
+            logger.warning("Path traversal attempt detected: %s", file_path)
             return None
         
         return str(full_path)
         
     except Exception as e:
-        logger.error(f"Error sanitizing file path: {str(e)}")
+        logger.error("Error sanitizing file path: %s", e)
         return None
 
+@functools.lru_cache(maxsize=32)
+def _resolve_base(base_directory: str, cwd: str) -> Path:
+    """Resolved base directory; cwd is part of the key since relative bases depend on it."""
+    return Path(base_directory).resolve()
+
 def validate_tool_name(tool_name: str) -> bool:
     """
     Validate tool name for function calling.
@@ -461,20 +550,20 @@ def validate_tool_name(tool_name: str) -> bool:
     Returns:
         True if valid
     """
-    if not tool_name or not isinstance(tool_name, str):
+    # Type and reasonable length limits (the lower bound also rejects empty names)
+    if not isinstance(tool_name, str) or not 1 <= len(tool_name) <= 50:
         return False
     
     # Allow alphanumeric and underscores (Python function name style)
-    if not re.match(r'^[A-Za-z][A-Za-z0-9_]*$', tool_name):
+    try:
+        name_bytes = tool_name.encode('ascii')
+    except UnicodeEncodeError:
         return False
-    
-    # Reasonable length limits
-    if not 1 <= len(tool_name) <= 50:
+    if name_bytes[:1].translate(None, _TOOL_NAME_FIRST_BYTES) or name_bytes.translate(None, _TOOL_NAME_BYTES):
         return False
     
     # Avoid reserved words
-    reserved_words = ['def', 'class', 'if', 'else', 'while', 'for', 'import', 'return']
-    if tool_name.lower() in reserved_words:
+    if tool_name.lower() in _RESERVED_WORDS:
         return False
     
     return True